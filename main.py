@@ -171,13 +171,11 @@ class DiscordBotApp:
                             next_run_dt = datetime.fromisoformat(next_run)
                             if now >= next_run_dt:
                                 logger.info(f"Running scheduled task: {task.get('source')}")
-                                self.status_var.set(f"Running scheduled task: {task.get('source')}")
+                                # Tk variables are only set from the main thread
+                                self.root.after(0, self.status_var.set, f"Running scheduled task: {task.get('source')}")
                                 
-                                # Run the task using the schedule tab's execute method
-                                threading.Thread(
-                                    target=self.schedule_tab._execute_task,
-                                    args=(task,)
-                                ).start()
+                                # Run the task on the schedule tab's worker threads
+                                self.schedule_tab.submit_task(task)
                         except (ValueError, TypeError) as e:
                             logger.error(f"Error parsing next run time: {e}")
                 
@@ -197,6 +195,8 @@ class DiscordBotApp:
         """Handle window close event."""
         logger.info("Closing application")
         self.scheduler_running = False
+        self.schedule_tab.save_pending_tasks(fsync=True)
+        self.config_manager.close()
         self.root.destroy()
 
 
@@ -5,6 +5,7 @@ Handles communication with Discord webhooks.
 """
 
 import json
+import time
 import logging
 import requests
 from datetime import datetime
@@ -18,6 +19,30 @@ from ..utils.error_handler import (
 
 logger = logging.getLogger(__name__)
 
+# Longest rate limit wait, in seconds, before a send is retried; longer waits fail the send
+_MAX_RETRY_AFTER = 60
+
+
+def _retry_after(response):
+    """
+    Get how long Discord asks a rate limited client to wait.
+    
+    Args:
+        response: Rate limited response
+        
+    Returns:
+        float: Seconds to wait, from the Retry-After header, else the JSON body's
+            retry_after, else 1
+    """
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, float(response.json().get("retry_after")))
+    except (TypeError, ValueError, AttributeError):
+        return 1.0
+
 
 class DiscordConnector(PlatformConnector):
     """Discord API connector."""
@@ -208,6 +233,22 @@ class DiscordConnector(PlatformConnector):
         
         try:
             response = requests.post(webhook_url, json=payload)
+            
+            # If rate limited, wait as long as Discord asks and try once more
+            if response.status_code == 429:
+                retry_after = _retry_after(response)
+                if retry_after > _MAX_RETRY_AFTER:
+                    error_message = f"Webhook rate limited for {retry_after} seconds"
+                    logger.error(error_message)
+                    return {
+                        "success": False,
+                        "error": error_message,
+                        "response": None
+                    }
+                logger.warning(f"Webhook rate limited, retrying in {retry_after} seconds")
+                time.sleep(retry_after)
+                response = requests.post(webhook_url, json=payload)
+            
             response.raise_for_status()
             
             return {
@@ -3,11 +3,46 @@ Content Processor Module
 Handles filtering, formatting, and processing of content from various platforms
 """
 import re
+import sys
 import logging
+import functools
 from datetime import datetime
 
 logger = logging.getLogger('content_curator.processor')
 
+# Item fields read by the filters and formatters. Keys coming out of JSON
+# parsers are not interned, so items are rewritten to use these objects
+# and every lookup hits on identity instead of a full string compare.
+_FIELDS = tuple(sys.intern(k) for k in (
+    'views', 'likes', 'upvotes', 'comments', 'shares', 'retweets',
+    'channel', 'subreddit', 'username', 'type', 'author', 'title', 'url',
+    'thumbnail', 'image', 'description', 'content', 'text', 'duration'
+))
+_FIELD_KEYS = {key: key for key in _FIELDS}
+
+# Thousands-separated integer formatting for embed field values
+_fmt_int = "{:,}".format
+
+# Embed fields per platform as (item key, field name, value kind)
+_FIELD_SPECS = {
+    'youtube': (('views', 'Views', 'int'), ('likes', 'Likes', 'int'), ('duration', 'Duration', 'str')),
+    'reddit': (('upvotes', 'Upvotes', 'int'), ('comments', 'Comments', 'int'), ('subreddit', 'Subreddit', 'subreddit')),
+    'twitter': (('likes', 'Likes', 'int'), ('retweets', 'Retweets', 'int')),
+}
+_FORMATTERS = {
+    'int': _fmt_int,
+    'str': str,
+    'subreddit': "r/{}".format,
+}
+
+# Template placeholders, e.g. {title}
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+def _intern_keys(item):
+    """Return a copy of an item keyed by the interned field names"""
+    return {_FIELD_KEYS.get(key, key): value for key, value in item.items()}
+
 class ContentProcessor:
     def __init__(self, config):
         """
@@ -19,6 +54,25 @@ class ContentProcessor:
         self.config = config
         self.global_filters = config['filters']['global']
         self.platform_filters = config['filters']
+        
+        # Lower-case keywords and thresholds once instead of per item
+        self._include_keywords = tuple(kw.lower() for kw in self.global_filters.get('keywords_include') or ())
+        self._exclude_keywords = tuple(kw.lower() for kw in self.global_filters.get('keywords_exclude') or ())
+        self._min_engagement = self.global_filters.get('min_engagement') or 0
+        
+        # Platforms whose templates post content only don't need an embed
+        formatting = config.get('formatting', {})
+        self._embed_enabled = {
+            p: formatting.get(p, {}).get('embed', True)
+            for p in ('youtube', 'reddit', 'twitter', 'instagram')
+        }
+        
+        # Templates are fixed per platform, so parse them once
+        self._compiled_templates = {
+            platform: self._compile_template(cfg.get('template', '{url}'))
+            for platform, cfg in formatting.items()
+        }
+        self._default_template = self._compile_template('{url}')
     
     def process_content(self, platform, items):
         """
@@ -33,6 +87,9 @@ class ContentProcessor:
         """
         logger.info(f"Processing {len(items)} items from {platform}")
         
+        # Normalize keys once at batch entry
+        items = [_intern_keys(item) for item in items]
+        
         # Apply filters
         filtered_items = self.filter_content(platform, items)
         
@@ -92,20 +149,23 @@ class ContentProcessor:
         Returns:
             bool: True if the item passes global filters
         """
+        # Lower-case the item text once for both keyword checks
+        if self._include_keywords or self._exclude_keywords:
+            text = self._item_to_text(item).lower()
+        
         # Check for keywords to include
-        if self.global_filters.get('keywords_include'):
-            if not any(kw.lower() in self._item_to_text(item).lower() for kw in self.global_filters['keywords_include']):
+        if self._include_keywords:
+            if not any(kw in text for kw in self._include_keywords):
                 return False
         
         # Check for keywords to exclude
-        if self.global_filters.get('keywords_exclude'):
-            if any(kw.lower() in self._item_to_text(item).lower() for kw in self.global_filters['keywords_exclude']):
+        if self._exclude_keywords:
+            if any(kw in text for kw in self._exclude_keywords):
                 return False
         
         # Check minimum engagement
-        if self.global_filters.get('min_engagement'):
-            engagement = self._calculate_engagement(item)
-            if engagement < self.global_filters['min_engagement']:
+        if self._min_engagement:
+            if self._calculate_engagement(item) < self._min_engagement:
                 return False
         
         return True
@@ -166,11 +226,7 @@ class ContentProcessor:
     
     def _item_to_text(self, item):
         """Convert an item to text for keyword filtering"""
-        text = ""
-        for key, value in item.items():
-            if isinstance(value, str):
-                text += value + " "
-        return text
+        return ' '.join(value for value in item.values() if isinstance(value, str))
     
     def _calculate_engagement(self, item):
         """Calculate engagement score for an item"""
@@ -196,19 +252,18 @@ class ContentProcessor:
             
         Returns:
             dict: Formatted item with 'content' and 'embed' fields
+                (embed is None when disabled for the platform)
         """
-        # Get the platform-specific template
-        template = self.config['formatting'].get(platform, {}).get('template', '{url}')
-        
-        # Format the content
-        content = template
-        for key, value in item.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in content:
-                content = content.replace(placeholder, str(value))
+        # Format the content with the template compiled for the platform at init,
+        # leaving placeholders for fields the item doesn't have as they are
+        parts = self._compiled_templates.get(platform, self._default_template)
+        content = self._render_template(parts, item, keep_missing=True)
         
         # Create an embed for rich content
-        embed = self._create_embed(platform, item)
+        if self._embed_enabled.get(platform, True):
+            embed = self._create_embed(platform, item)
+        else:
+            embed = None
         
         return {
             'platform': platform,
@@ -250,28 +305,10 @@ class ContentProcessor:
         
         # Add fields for platform-specific metadata
         fields = []
-        
-        if platform == 'youtube':
-            if 'views' in item:
-                fields.append({'name': 'Views', 'value': f"{item['views']:,}", 'inline': True})
-            if 'likes' in item:
-                fields.append({'name': 'Likes', 'value': f"{item['likes']:,}", 'inline': True})
-            if 'duration' in item:
-                fields.append({'name': 'Duration', 'value': item['duration'], 'inline': True})
-        
-        elif platform == 'reddit':
-            if 'upvotes' in item:
-                fields.append({'name': 'Upvotes', 'value': f"{item['upvotes']:,}", 'inline': True})
-            if 'comments' in item:
-                fields.append({'name': 'Comments', 'value': f"{item['comments']:,}", 'inline': True})
-            if 'subreddit' in item:
-                fields.append({'name': 'Subreddit', 'value': f"r/{item['subreddit']}", 'inline': True})
-        
-        elif platform == 'twitter':
-            if 'likes' in item:
-                fields.append({'name': 'Likes', 'value': f"{item['likes']:,}", 'inline': True})
-            if 'retweets' in item:
-                fields.append({'name': 'Retweets', 'value': f"{item['retweets']:,}", 'inline': True})
+        for key, name, kind in _FIELD_SPECS.get(platform, ()):
+            value = item.get(key)
+            if value is not None:
+                fields.append({'name': name, 'value': _FORMATTERS[kind](value), 'inline': True})
         
         if fields:
             embed['fields'] = fields
@@ -288,6 +325,53 @@ class ContentProcessor:
         }
         return colors.get(platform, 0x7289DA)  # Default Discord color
     
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _compile_template(template):
+        """
+        Split a template into (literal, field) parts
+        
+        Args:
+            template (str): Template string with {placeholders}
+            
+        Returns:
+            tuple: (literal, None) and (None, field) pairs in template order
+        """
+        parts = []
+        pos = 0
+        for match in _PLACEHOLDER_RE.finditer(template):
+            if match.start() > pos:
+                parts.append((template[pos:match.start()], None))
+            parts.append((None, match.group(1)))
+            pos = match.end()
+        if pos < len(template):
+            parts.append((template[pos:], None))
+        return tuple(parts)
+    
+    @staticmethod
+    def _render_template(parts, item, keep_missing=False):
+        """
+        Render compiled template parts
+        
+        Args:
+            parts (tuple): Parts from _compile_template
+            item (dict): Content item
+            keep_missing (bool): Keep the {placeholder} of missing fields instead
+                of rendering an empty string
+            
+        Returns:
+            str: Rendered text
+        """
+        chunks = []
+        for literal, field in parts:
+            if field is None:
+                chunks.append(literal)
+            elif field in item:
+                chunks.append(str(item[field]))
+            elif keep_missing:
+                chunks.append(f"{{{field}}}")
+        return ''.join(chunks)
+    
     def format_content_with_template(self, item, template):
         """
         Format content with a custom template
@@ -299,14 +383,9 @@ class ContentProcessor:
         Returns:
             str: Formatted content
         """
-        # Use re.sub with a function to handle placeholders
-        def replace_placeholder(match):
-            field = match.group(1)
-            return str(item.get(field, ''))
-        
-        # Replace {field} with the corresponding value or empty string if missing
-        content = re.sub(r'\{(\w+)\}', replace_placeholder, template)
-        return content
+        # Replace {field} with the corresponding value or empty string if missing;
+        # compiled templates are cached, so repeated templates are parsed once
+        return self._render_template(self._compile_template(template), item)
     
     def format_content(self, platform, item):
         """
@@ -319,8 +398,6 @@ class ContentProcessor:
         Returns:
             str: Formatted content string
         """
-        # Get the template for the platform
-        template = self.config.get('formatting', {}).get(platform, {}).get('template', '{url}')
-        
-        # Use the template formatting method
-        return self.format_content_with_template(item, template)
+        # Use the template compiled for the platform at init
+        parts = self._compiled_templates.get(platform, self._default_template)
+        return self._render_template(parts, item)
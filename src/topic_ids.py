@@ -48,51 +48,108 @@ TOPIC_IDS = {
 }
 
 # Topic IDs organized by category
+# Stored as parallel tuples: names[i] is the friendly name for ids[i]
 TOPIC_CATEGORIES = {
-    "Gaming": [
-        {"name": "Gaming (All)", "id": "/m/0bzvm2"},
-        {"name": "Action Games", "id": "/m/02ntfj"},
-        {"name": "Puzzle Games", "id": "/m/04qvtq"},
-        {"name": "RPG Games", "id": "/m/0403l3g"},
-        {"name": "Strategy Games", "id": "/m/021bp2"},
-        {"name": "Simulation Games", "id": "/m/04q1x3q"}
-    ],
-    "Music": [
-        {"name": "Music (All)", "id": "/m/04rlf"},
-        {"name": "Pop Music", "id": "/m/064t9"},
-        {"name": "Rock Music", "id": "/m/06by7"},
-        {"name": "Hip Hop", "id": "/m/0glt670"},
-        {"name": "Electronic Music", "id": "/m/02lkt"},
-        {"name": "Classical Music", "id": "/m/0ggq0m"}
-    ],
-    "Technology": [
-        {"name": "Technology (All)", "id": "/m/07c1v"},
-        {"name": "Software", "id": "/m/01mf0"},
-        {"name": "Computer Hardware", "id": "/m/01mfj"},
-        {"name": "Artificial Intelligence", "id": "/m/0mkz"},
-        {"name": "Programming", "id": "/m/05z1_"}
-    ],
-    "Science": [
-        {"name": "Science (All)", "id": "/m/06ms67"},
-        {"name": "Physics", "id": "/m/05qjc"},
-        {"name": "Chemistry", "id": "/m/01n32"},
-        {"name": "Biology", "id": "/m/01lq5c"},
-        {"name": "Astronomy", "id": "/m/01k8wb"}
-    ],
-    "Entertainment": [
-        {"name": "Entertainment (All)", "id": "/m/02jjt"},
-        {"name": "Film", "id": "/m/02vxn"},
-        {"name": "Television", "id": "/m/0f2f9"},
-        {"name": "Comedy", "id": "/m/09kqc"},
-        {"name": "Animation", "id": "/m/0jxy"}
-    ],
-    "Lifestyle": [
-        {"name": "Fashion", "id": "/m/032tl"},
-        {"name": "Food", "id": "/m/02wbm"},
-        {"name": "Travel", "id": "/m/07bxq"},
-        {"name": "Fitness", "id": "/m/027x7n"},
-        {"name": "Beauty", "id": "/m/041xxh"}
-    ]
+    "Gaming": {
+        "names": (
+            "Gaming (All)",
+            "Action Games",
+            "Puzzle Games",
+            "RPG Games",
+            "Strategy Games",
+            "Simulation Games"
+        ),
+        "ids": (
+            "/m/0bzvm2",
+            "/m/02ntfj",
+            "/m/04qvtq",
+            "/m/0403l3g",
+            "/m/021bp2",
+            "/m/04q1x3q"
+        )
+    },
+    "Music": {
+        "names": (
+            "Music (All)",
+            "Pop Music",
+            "Rock Music",
+            "Hip Hop",
+            "Electronic Music",
+            "Classical Music"
+        ),
+        "ids": (
+            "/m/04rlf",
+            "/m/064t9",
+            "/m/06by7",
+            "/m/0glt670",
+            "/m/02lkt",
+            "/m/0ggq0m"
+        )
+    },
+    "Technology": {
+        "names": (
+            "Technology (All)",
+            "Software",
+            "Computer Hardware",
+            "Artificial Intelligence",
+            "Programming"
+        ),
+        "ids": (
+            "/m/07c1v",
+            "/m/01mf0",
+            "/m/01mfj",
+            "/m/0mkz",
+            "/m/05z1_"
+        )
+    },
+    "Science": {
+        "names": (
+            "Science (All)",
+            "Physics",
+            "Chemistry",
+            "Biology",
+            "Astronomy"
+        ),
+        "ids": (
+            "/m/06ms67",
+            "/m/05qjc",
+            "/m/01n32",
+            "/m/01lq5c",
+            "/m/01k8wb"
+        )
+    },
+    "Entertainment": {
+        "names": (
+            "Entertainment (All)",
+            "Film",
+            "Television",
+            "Comedy",
+            "Animation"
+        ),
+        "ids": (
+            "/m/02jjt",
+            "/m/02vxn",
+            "/m/0f2f9",
+            "/m/09kqc",
+            "/m/0jxy"
+        )
+    },
+    "Lifestyle": {
+        "names": (
+            "Fashion",
+            "Food",
+            "Travel",
+            "Fitness",
+            "Beauty"
+        ),
+        "ids": (
+            "/m/032tl",
+            "/m/02wbm",
+            "/m/07bxq",
+            "/m/027x7n",
+            "/m/041xxh"
+        )
+    }
 }
 
 # Order parameters for search results
@@ -103,3 +160,17 @@ ORDER_OPTIONS = [
     {"name": "Rating", "value": "rating"},
     {"name": "Title", "value": "title"}
 ]
+
+
+def category_entries(category):
+    """
+    Get the topics in a category as (name, id) pairs.
+    
+    Args:
+        category: Category name, e.g. "Gaming"
+        
+    Returns:
+        list: List of (name, topic_id) tuples
+    """
+    topics = TOPIC_CATEGORIES[category]
+    return list(zip(topics["names"], topics["ids"]))
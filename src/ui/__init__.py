@@ -2,14 +2,32 @@
 Discord Webhook Bot UI Module.
 
 This package contains the user interface components for the Discord Webhook Bot.
+Classes are imported on first access, so importing one UI module does not load
+every tab and its API clients.
 """
 
-from .base_ui import BaseUI
-from .discord_tab import DiscordTab
-from .youtube_tab import YouTubeTab
-from .api_config_tab import ApiConfigTab
-from .schedule_tab import TasksTab, ScheduleTab
-from .fetching_tab import FetchingTab
-from .discord_bot_ui import DiscordBotUI
+import importlib
 
-__all__ = ['BaseUI', 'DiscordTab', 'YouTubeTab', 'ApiConfigTab', 'TasksTab', 'ScheduleTab', 'FetchingTab', 'DiscordBotUI']
+# Public classes and the modules that define them
+_EXPORTS = {
+    'BaseUI': '.base_ui',
+    'DiscordTab': '.discord_tab',
+    'YouTubeTab': '.youtube_tab',
+    'ApiConfigTab': '.api_config_tab',
+    'TasksTab': '.schedule_tab',
+    'ScheduleTab': '.schedule_tab',
+    'FetchingTab': '.fetching_tab',
+    'DiscordBotUI': '.discord_bot_ui',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import a public class on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -7,28 +7,42 @@ Manages API keys and credentials for various services.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import functools
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from .base_ui import BaseUI
+from src.api_connectors import get_connector
+from src.utils.encryption import get_cipher, encrypt_value, decrypt_value
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for connection tests so repeated clicks don't each spawn a thread
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="api-test")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_cached_connector(platform, credential_items):
+    """Get a connector for the given credentials, reusing one already built."""
+    return get_connector(platform, dict(credential_items))
+
 
 class ApiConfigTab(BaseUI):
     """API configuration tab."""
     
-    # API platforms
-    API_PLATFORMS = [
-        {
+    # API platforms (read-only; the lookups below are built from them)
+    API_PLATFORMS = (
+        MappingProxyType({
             "name": "YouTube",
             "id": "youtube",
-            "fields": [
-                {
+            "fields": (
+                MappingProxyType({
                     "name": "API Key",
                     "id": "api_key",
                     "type": "password",
                     "description": ("YouTube API Key from Google Cloud Console. "
                                   "Required for YouTube search functionality.")
-                }
-            ],
+                }),
+            ),
             "help_text": (
                 "To get a YouTube API Key:\n"
                 "1. Go to Google Cloud Console (https://console.cloud.google.com/)\n"
@@ -37,36 +51,36 @@ class ApiConfigTab(BaseUI):
                 "4. Create an API key from the Credentials section\n"
                 "5. Paste the API key here"
             )
-        },
-        {
+        }),
+        MappingProxyType({
             "name": "Reddit",
             "id": "reddit",
-            "fields": [
-                {
+            "fields": (
+                MappingProxyType({
                     "name": "Client ID",
                     "id": "client_id",
                     "type": "text",
                     "description": "Client ID from Reddit Developer Application"
-                },
-                {
+                }),
+                MappingProxyType({
                     "name": "Client Secret",
                     "id": "client_secret",
                     "type": "password",
                     "description": "Client Secret from Reddit Developer Application"
-                },
-                {
+                }),
+                MappingProxyType({
                     "name": "Username",
                     "id": "username",
                     "type": "text",
                     "description": "Reddit username"
-                },
-                {
+                }),
+                MappingProxyType({
                     "name": "Password",
                     "id": "password",
                     "type": "password",
                     "description": "Reddit password"
-                }
-            ],
+                }),
+            ),
             "help_text": (
                 "To get Reddit API credentials:\n"
                 "1. Go to https://www.reddit.com/prefs/apps\n"
@@ -78,36 +92,36 @@ class ApiConfigTab(BaseUI):
                 "7. The Client ID is under the app name\n"
                 "8. The Client Secret is labeled 'secret'"
             )
-        },
-        {
+        }),
+        MappingProxyType({
             "name": "Twitter",
             "id": "twitter",
-            "fields": [
-                {
+            "fields": (
+                MappingProxyType({
                     "name": "API Key",
                     "id": "api_key",
                     "type": "text",
                     "description": "Twitter API Key (Consumer Key)"
-                },
-                {
+                }),
+                MappingProxyType({
                     "name": "API Secret",
                     "id": "api_secret",
                     "type": "password",
                     "description": "Twitter API Secret (Consumer Secret)"
-                },
-                {
+                }),
+                MappingProxyType({
                     "name": "Access Token",
                     "id": "access_token",
                     "type": "text",
                     "description": "Twitter Access Token"
-                },
-                {
+                }),
+                MappingProxyType({
                     "name": "Access Token Secret",
                     "id": "access_token_secret",
                     "type": "password",
                     "description": "Twitter Access Token Secret"
-                }
-            ],
+                }),
+            ),
             "help_text": (
                 "To get Twitter API credentials:\n"
                 "1. Go to https://developer.twitter.com/\n"
@@ -115,8 +129,26 @@ class ApiConfigTab(BaseUI):
                 "3. Navigate to 'Keys and Tokens'\n"
                 "4. Generate Consumer Keys and Access Tokens"
             )
-        }
-    ]
+        })
+    )
+    
+    # Platform lookups built once from API_PLATFORMS
+    _PLATFORMS_BY_NAME = {p["name"]: p for p in API_PLATFORMS}
+    _PLATFORMS_BY_ID = {p["id"]: p for p in API_PLATFORMS}
+    _PLATFORM_NAMES = tuple(p["name"] for p in API_PLATFORMS)
+    
+    # Connection test methods by platform ID
+    _TEST_DISPATCH = {
+        "youtube": "_test_youtube_connection",
+        "reddit": "_test_reddit_connection",
+        "twitter": "_test_twitter_connection",
+    }
+    
+    # Fields stored encrypted in the config file, by platform ID
+    _PASSWORD_FIELDS = {
+        p["id"]: frozenset(f["id"] for f in p["fields"] if f["type"] == "password")
+        for p in API_PLATFORMS
+    }
     
     def __init__(self, parent, config_manager):
         """
@@ -127,12 +159,27 @@ class ApiConfigTab(BaseUI):
             config_manager: Configuration manager instance
         """
         self.api_entries = {}
+        self._dirty_fields = {}
+        self._platform_frames = {}
+        self._current_platform_id = None
+        self._api_keys_cache = None
+        self._refresh_pending = False
         super().__init__(parent, config_manager, "API Configuration")
-        # Select first platform by default
+        # Select first platform by default, building its widgets when the tab is first shown
         if self.API_PLATFORMS:
             platform_name = self.API_PLATFORMS[0]["name"]
             self.platform_var.set(platform_name)
-            self._on_platform_selected(None)
+            self._first_show_binding = self.frame.bind("<Map>", self._on_first_show, add="+")
+    
+    def _on_first_show(self, event):
+        """
+        Build the selected platform's settings the first time the tab is shown.
+        
+        Args:
+            event: Map event
+        """
+        self.frame.unbind("<Map>", self._first_show_binding)
+        self._on_platform_selected(None)
     
     def _init_ui(self):
         """Initialize the UI components."""
@@ -146,10 +193,9 @@ class ApiConfigTab(BaseUI):
         
         ttk.Label(platform_frame, text="Platform:").pack(side=tk.LEFT, padx=5)
         
-        platform_names = [platform["name"] for platform in self.API_PLATFORMS]
         self.platform_var = tk.StringVar()
         
-        platform_combo = ttk.Combobox(platform_frame, textvariable=self.platform_var, values=platform_names, state="readonly")
+        platform_combo = ttk.Combobox(platform_frame, textvariable=self.platform_var, values=self._PLATFORM_NAMES, state="readonly")
         platform_combo.pack(side=tk.LEFT, padx=5)
         platform_combo.bind("<<ComboboxSelected>>", self._on_platform_selected)
         
@@ -169,6 +215,24 @@ class ApiConfigTab(BaseUI):
         status_label = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=2)
         
+    def _api_keys(self):
+        """
+        Get the saved API keys, cached until the configuration changes.
+        
+        Returns:
+            dict: Decrypted API keys by platform ID
+        """
+        if self._api_keys_cache is None:
+            cipher = get_cipher(self.config_manager.config_dir)
+            self._api_keys_cache = {
+                platform_id: {
+                    field_id: decrypt_value(cipher, value) if field_id in self._PASSWORD_FIELDS.get(platform_id, ()) else value
+                    for field_id, value in creds.items()
+                }
+                for platform_id, creds in self.config_manager.config.get("api_keys", {}).items()
+            }
+        return self._api_keys_cache
+    
     def _on_platform_selected(self, event):
         """
         Handle platform selection.
@@ -176,72 +240,108 @@ class ApiConfigTab(BaseUI):
         Args:
             event: ComboboxSelected event
         """
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
         # Get selected platform
         platform_name = self.platform_var.get()
-        platform = next((p for p in self.API_PLATFORMS if p["name"] == platform_name), None)
+        platform = self._PLATFORMS_BY_NAME.get(platform_name)
         
         if not platform:
             return
         
+        platform_id = platform["id"]
+        if platform_id == self._current_platform_id:
+            return
+        
+        # Hide the previous platform's settings
+        if self._current_platform_id in self._platform_frames:
+            self._platform_frames[self._current_platform_id].pack_forget()
+        
+        # Build the settings frame on first selection, otherwise just refresh its values
+        if platform_id in self._platform_frames:
+            self._load_entries(platform)
+        else:
+            self._platform_frames[platform_id] = self._create_platform_frame(platform)
+        
+        self._platform_frames[platform_id].pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._current_platform_id = platform_id
+        
+        # Update status
+        self.status_var.set(f"Configuring {platform_name} API")
+    
+    def _create_platform_frame(self, platform):
+        """
+        Create the settings frame for a platform.
+        
+        Args:
+            platform: Platform definition from API_PLATFORMS
+            
+        Returns:
+            ttk.LabelFrame: Settings frame (not packed)
+        """
         # Get existing API keys
         platform_id = platform["id"]
-        creds = self.config_manager.config.get("api_keys", {}).get(platform_id, {})
+        creds = self._api_keys().get(platform_id, {})
         
         # Create settings frame
-        settings_frame = ttk.LabelFrame(self.content_frame, text=f"{platform_name} API Configuration")
-        settings_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        settings_frame = ttk.LabelFrame(self.content_frame, text=f"{platform['name']} API Configuration")
         
         # Create entries for each field
         self.api_entries[platform_id] = {}
+        self._dirty_fields[platform_id] = set()
         
         for i, field in enumerate(platform["fields"]):
-            # Create field frame
-            field_frame = ttk.Frame(settings_frame)
-            field_frame.pack(fill=tk.X, padx=5, pady=5)
-            
             # Add label
-            ttk.Label(field_frame, text=f"{field['name']}:").grid(row=i, column=0, sticky="w", padx=5, pady=2)
+            ttk.Label(settings_frame, text=f"{field['name']}:").grid(row=i, column=0, sticky="w", padx=5, pady=5)
             
             # Add entry
             field_id = field["id"]
             field_var = tk.StringVar(value=creds.get(field_id, ""))
             
             if field["type"] == "password":
-                entry = ttk.Entry(field_frame, textvariable=field_var, show="*", width=40)
+                entry = ttk.Entry(settings_frame, textvariable=field_var, show="*", width=40)
             else:
-                entry = ttk.Entry(field_frame, textvariable=field_var, width=40)
+                entry = ttk.Entry(settings_frame, textvariable=field_var, width=40)
             
-            entry.grid(row=i, column=1, sticky="we", padx=5, pady=2)
+            entry.grid(row=i, column=1, sticky="we", padx=5, pady=5)
             
             # Add description
-            ttk.Label(field_frame, text=field["description"], foreground="gray").grid(row=i, column=2, sticky="w", padx=5, pady=2)
+            ttk.Label(settings_frame, text=field["description"], foreground="gray").grid(row=i, column=2, sticky="w", padx=5, pady=5)
             
-            # Store entry variable
+            # Store entry variable and track edits to it
             self.api_entries[platform_id][field_id] = field_var
+            field_var.trace_add("write", lambda *args, pid=platform_id, fid=field_id: self._dirty_fields[pid].add(fid))
+        
+        settings_frame.columnconfigure(1, weight=1)
         
         # Add help text
         if platform.get("help_text"):
             help_frame = ttk.LabelFrame(settings_frame, text="Help")
-            help_frame.pack(fill=tk.X, padx=5, pady=5)
+            help_frame.grid(row=len(platform["fields"]), column=0, columnspan=3, sticky="we", padx=5, pady=5)
             
-            help_text = tk.Text(help_frame, height=10, wrap=tk.WORD)
-            help_text.pack(fill=tk.X, padx=5, pady=5)
-            
-            help_text.insert(tk.END, platform["help_text"])
-            help_text.config(state=tk.DISABLED)
+            ttk.Label(help_frame, text=platform["help_text"], wraplength=600, justify=tk.LEFT).pack(fill=tk.X, padx=5, pady=5)
         
-        # Update status
-        self.status_var.set(f"Configuring {platform_name} API")
+        return settings_frame
+    
+    def _load_entries(self, platform):
+        """
+        Refresh a platform's entry values from the saved credentials.
+        
+        Args:
+            platform: Platform definition from API_PLATFORMS
+        """
+        platform_id = platform["id"]
+        creds = self._api_keys().get(platform_id, {})
+        
+        for field_id, field_var in self.api_entries.get(platform_id, {}).items():
+            field_var.set(creds.get(field_id, ""))
+        
+        # Values now match the saved credentials
+        self._dirty_fields.get(platform_id, set()).clear()
     
     def _save_credentials(self):
         """Save API credentials."""
         # Get selected platform
         platform_name = self.platform_var.get()
-        platform = next((p for p in self.API_PLATFORMS if p["name"] == platform_name), None)
+        platform = self._PLATFORMS_BY_NAME.get(platform_name)
         
         if not platform:
             return
@@ -249,24 +349,28 @@ class ApiConfigTab(BaseUI):
         # Get platform ID
         platform_id = platform["id"]
         
-        # Get current API keys
-        api_keys = self.config_manager.config.get("api_keys", {})
-        if platform_id not in api_keys:
-            api_keys[platform_id] = {}
-        
-        # Update with new values
-        for field in platform["fields"]:
-            field_id = field["id"]
-            if platform_id in self.api_entries and field_id in self.api_entries[platform_id]:
-                field_var = self.api_entries[platform_id][field_id]
-                value = field_var.get()
-                
-                # Only update if not empty
-                if value:
-                    api_keys[platform_id][field_id] = value
-        
-        # Save API keys
-        self.config_manager.update_config("api_keys", api_keys)
+        # Get current API keys for this platform
+        current = self._api_keys().get(platform_id, {})
+        updated = dict(current)
+        
+        # Update with edited values (an emptied field clears the saved value)
+        entries = self.api_entries.get(platform_id, {})
+        dirty = self._dirty_fields.get(platform_id, set())
+        for field_id in dirty:
+            updated[field_id] = entries[field_id].get()
+        dirty.clear()
+        
+        # Save only this platform's keys, and only if something changed
+        if updated != current:
+            # Encrypt password fields before they reach the config file
+            cipher = get_cipher(self.config_manager.config_dir)
+            password_fields = self._PASSWORD_FIELDS[platform_id]
+            stored = {
+                field_id: encrypt_value(cipher, value) if field_id in password_fields else value
+                for field_id, value in updated.items()
+            }
+            self.config_manager.update_config_key("api_keys", platform_id, stored)
+            self._api_keys_cache = None
         
         # Update status
         self.status_var.set(f"{platform_name} API credentials saved")
@@ -276,18 +380,18 @@ class ApiConfigTab(BaseUI):
         """Test API connection."""
         # Get selected platform
         platform_name = self.platform_var.get()
-        platform = next((p for p in self.API_PLATFORMS if p["name"] == platform_name), None)
+        platform = self._PLATFORMS_BY_NAME.get(platform_name)
         
         if not platform:
             return
         
-        # Get platform credentials
+        # Get platform credentials as currently entered, so they can be tested before saving
         platform_id = platform["id"]
-        credentials = self.config_manager.config.get("api_keys", {}).get(platform_id, {})
+        credentials = {field_id: var.get() for field_id, var in self.api_entries.get(platform_id, {}).items()}
         
         # Check if credentials are empty
-        if not credentials:
-            messagebox.showerror("Connection Test", f"No {platform_name} API credentials found. Please enter and save them first.")
+        if not any(credentials.values()):
+            messagebox.showerror("Connection Test", f"No {platform_name} API credentials found. Please enter them first.")
             return
         
         # Validate credentials are present
@@ -295,19 +399,16 @@ class ApiConfigTab(BaseUI):
             field_id = field["id"]
             if field_id not in credentials or not credentials[field_id]:
                 messagebox.showwarning("Missing Credentials", 
-                                    f"{field['name']} is required. Please save your credentials first.")
+                                    f"{field['name']} is required. Please enter your credentials first.")
                 return
         
         # Update status
         self.status_var.set(f"Testing {platform_name} API connection...")
         
         # Test connection based on platform
-        if platform_id == "youtube":
-            self._test_youtube_connection(credentials)
-        elif platform_id == "reddit":
-            self._test_reddit_connection(credentials)
-        elif platform_id == "twitter":
-            self._test_twitter_connection(credentials)
+        method_name = self._TEST_DISPATCH.get(platform_id)
+        if method_name:
+            getattr(self, method_name)(credentials)
     
     def _test_youtube_connection(self, credentials):
         """
@@ -318,11 +419,8 @@ class ApiConfigTab(BaseUI):
         """
         def test_task():
             try:
-                # Import the connector factory
-                from src.api_connectors import get_connector
-                
-                # Create YouTube connector
-                connector = get_connector("youtube", credentials)
+                # Create YouTube connector (reused across tests with the same credentials)
+                connector = _get_cached_connector("youtube", tuple(sorted(credentials.items())))
                 
                 # Validate credentials
                 if not connector.validate_credentials():
@@ -346,8 +444,9 @@ class ApiConfigTab(BaseUI):
                 messagebox.showerror("Connection Test", message)
                 self.status_var.set("YouTube API connection failed")
         
-        # Run test in background thread
-        self.run_async(test_task, handle_result)
+        # Run test on the shared pool and handle the result on the Tk thread
+        future = _EXECUTOR.submit(test_task)
+        future.add_done_callback(lambda f: self.frame.after(0, handle_result, f.result()))
     
     def _test_reddit_connection(self, credentials):
         """
@@ -373,5 +472,17 @@ class ApiConfigTab(BaseUI):
     
     def on_config_changed(self):
         """Handle configuration changes."""
-        # Refresh the current view
-        self._on_platform_selected(None)
+        self._api_keys_cache = None
+        
+        # Coalesce bursts of change notifications into a single refresh
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.frame.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Refresh the current view after configuration changes."""
+        self._refresh_pending = False
+        platform = self._PLATFORMS_BY_ID.get(self._current_platform_id)
+        if platform:
+            self._load_entries(platform)
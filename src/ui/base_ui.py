@@ -5,20 +5,168 @@ Contains common UI utilities, styles, and dialog creation functions.
 """
 
 import os
+import re
+import copy
 import json
+import queue
+import atexit
+import tempfile
+import weakref
+from types import MappingProxyType
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# orjson parses and encodes much faster than the json module; it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Start of each line in orjson's two-space indented output
+_LINE_INDENT_RE = re.compile(r"^( *)", re.MULTILINE)
+
+# Shared worker pool for BaseUI.run_async
+_ASYNC_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="ui-async")
+atexit.register(_ASYNC_POOL.shutdown, wait=False)
+
+def _load_json(path):
+    """
+    Load a JSON file, parsing it with orjson when it is installed.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def json_text(data):
+    """
+    Encode data as JSON the way json.dump with indent=4 writes it.
+    
+    orjson is used when it is installed and the data suits it; otherwise the
+    json module encodes the data.
+    
+    Args:
+        data: Data to encode
+        
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        try:
+            text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # Such as dict keys that aren't strings, which the json module converts
+            text = None
+        # orjson writes non-ASCII characters unescaped; the json module escapes them,
+        # which keeps the file readable whatever the platform's default encoding
+        if text is not None and text.isascii():
+            # Double the two-space indent
+            return _LINE_INDENT_RE.sub(r"\1\1", text)
+    return json.dumps(data, indent=4)
+
+
+def _atomic_write_json(path, data):
+    """
+    Write a JSON file via a temporary file so a partial write never replaces it.
+    
+    Args:
+        path: Path to the JSON file
+        data: Data to write
+    """
+    _atomic_write_text(path, json_text(data))
+
+
+def _atomic_write_text(path, text, fsync=False):
+    """
+    Write a text file via a temporary file so a partial write never replaces it.
+    
+    Args:
+        path: Path to the file
+        text: File contents
+        fsync: Whether the temporary file reaches the disk before it replaces the file
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as f:
+        f.write(text)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+
+def persistable_copy(data):
+    """
+    Copy config data for saving, leaving out runtime-only values.
+    
+    Dict keys starting with an underscore hold values cached for display and
+    are not written to disk.
+    
+    Args:
+        data: Config data made of dicts, lists and JSON scalars
+        
+    Returns:
+        Deep copy of the data without underscore keys
+    """
+    if isinstance(data, dict):
+        return {key: persistable_copy(value) for key, value in data.items()
+                if not (isinstance(key, str) and key.startswith("_"))}
+    if isinstance(data, list):
+        return [persistable_copy(value) for value in data]
+    return copy.deepcopy(data)
+
+
+def _freeze(mapping):
+    """
+    Wrap a nested dict in read-only mapping proxies.
+    
+    Args:
+        mapping: Dict whose dict values are frozen recursively
+        
+    Returns:
+        Read-only view of the dict
+    """
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+# ttk style names for each theme section
+_STYLE_NAMES = (
+    ('TButton', 'button'),
+    ('TFrame', 'frame'),
+    ('TLabel', 'label'),
+    ('TEntry', 'entry'),
+    ('Treeview', 'treeview'),
+    ('TNotebook.Tab', 'tab'),
+)
+
+
 class StyleManager:
     """Manages UI style and themes for the application."""
     
-    THEMES = {
+    # Read-only so the flattened styles below always match
+    THEMES = _freeze({
         'default': {
             'button': {'background': '#4a6ea9', 'foreground': 'white'},
             'frame': {'background': '#f5f5f5'},
@@ -35,21 +183,24 @@ class StyleManager:
             'treeview': {'background': '#2c3e50', 'foreground': '#ecf0f1'},
             'tab': {'background': '#2c3e50'}
         }
-    }
+    })
+    
+    # (style name, options) pairs per theme, flattened once
+    _FLAT = MappingProxyType({
+        name: tuple((style_name, theme[section]) for style_name, section in _STYLE_NAMES)
+        for name, theme in THEMES.items()
+    })
     
     @classmethod
     def configure(cls, style, theme_name='default'):
         """Configure the style for the application."""
-        style.theme_use('clam')
+        # Switching themes makes ttk recompute every style, so only do it once
+        if style.theme_use() != 'clam':
+            style.theme_use('clam')
         
         # Apply theme to ttk elements
-        theme = cls.THEMES.get(theme_name, cls.THEMES['default'])
-        style.configure('TButton', **theme['button'])
-        style.configure('TFrame', **theme['frame'])
-        style.configure('TLabel', **theme['label'])
-        style.configure('TEntry', **theme['entry'])
-        style.configure('Treeview', **theme['treeview'])
-        style.configure('TNotebook.Tab', **theme['tab'])
+        for style_name, options in cls._FLAT.get(theme_name, cls._FLAT['default']):
+            style.configure(style_name, **options)
         
         return style
 
@@ -63,31 +214,72 @@ class ConfigManager:
         self.credentials_file = os.path.join(config_dir, "credentials.json")
         self.config = self._load_config()
         self.credentials = self._load_credentials()
-        self.observers = []
+        # Observers keyed by callback, mapped to whether the key is a weak reference
+        self.observers = {}
+        
+        # Config writes happen on a background thread; the queue holds only the latest
+        # snapshot or encoded config text
+        self._save_queue = queue.Queue(maxsize=1)
+        self._save_lock = threading.Lock()
+        # Held while the file is written; queued writes numbered up to _superseded_seq
+        # are older than a direct write_config and are not written
+        self._write_lock = threading.Lock()
+        self._save_seq = 0
+        self._superseded_seq = 0
+        self._save_thread = threading.Thread(target=self._save_worker, name="config-writer", daemon=True)
+        self._save_thread.start()
+        atexit.register(self.flush)
     
     def add_observer(self, callback):
-        """Add an observer that will be notified of config changes."""
-        self.observers.append(callback)
+        """
+        Add an observer that will be notified of config changes.
+        
+        Bound methods are held weakly, so a destroyed tab stops being notified
+        once it is garbage collected. Plain functions are held strongly.
+        
+        Args:
+            callback: Function called with no arguments after each change
+        """
+        if hasattr(callback, '__self__'):
+            self.observers[weakref.WeakMethod(callback)] = True
+        else:
+            self.observers[callback] = False
     
     def update_config(self, section, values):
         """Update a section of the config and notify observers."""
         try:
-            logger.info(f"update_config called for section: {section} with {len(values) if isinstance(values, list) else 'non-list'} values")
-            old_values = self.config.get(section, None)
-            logger.info(f"Previous values in section {section}: {type(old_values).__name__}, {len(old_values) if isinstance(old_values, list) else 'N/A'}")
+            # Lazy %-style arguments skip formatting when INFO logging is off
+            count = len(values) if isinstance(values, list) else None
+            logger.info("update_config called for section: %s with %s values",
+                        section, "non-list" if count is None else count)
+            if logger.isEnabledFor(logging.INFO):
+                old_values = self.config.get(section)
+                logger.info("Previous values in section %s: %s, %s", section, type(old_values).__name__,
+                            len(old_values) if isinstance(old_values, list) else "N/A")
             
             self.config[section] = values
-            logger.info(f"Updated config[{section}] = {type(values).__name__} with {len(values) if isinstance(values, list) else 'N/A'} items")
+            logger.info("Updated config[%s] = %s with %s items", section, type(values).__name__,
+                        "N/A" if count is None else count)
             
             self._save_config()
-            logger.info(f"Config saved to {self.config_file}")
+            logger.info("Config saved to %s", self.config_file)
             
             self._notify_observers()
-            logger.info(f"Notified {len(self.observers)} observers")
         except Exception as e:
             logger.error(f"Error in update_config: {e}", exc_info=True)
             raise
     
+    def update_config_key(self, section, key, value):
+        """Update a single key within a config section and notify observers."""
+        try:
+            logger.info("update_config_key called for %s.%s", section, key)
+            self.config.setdefault(section, {})[key] = value
+            self._save_config()
+            self._notify_observers()
+        except Exception as e:
+            logger.error(f"Error in update_config_key: {e}", exc_info=True)
+            raise
+    
     def update_credentials(self, section, values):
         """Update credentials and notify observers."""
         self.credentials[section] = values
@@ -96,21 +288,30 @@ class ConfigManager:
     
     def _notify_observers(self):
         """Notify all observers of a change."""
-        logger.info(f"Notifying {len(self.observers)} observers of config change...")
-        for i, callback in enumerate(self.observers):
+        # Resolve weak references, dropping observers that no longer exist
+        callbacks = []
+        for key, is_weak in list(self.observers.items()):
+            callback = key() if is_weak else key
+            if callback is None:
+                del self.observers[key]
+            else:
+                callbacks.append(callback)
+        
+        count = len(callbacks)
+        logger.info("Notifying %d observers of config change...", count)
+        for i, callback in enumerate(callbacks, 1):
             try:
-                logger.info(f"Calling observer {i+1}...")
+                logger.debug("Calling observer %d...", i)
                 callback()
-                logger.info(f"Observer {i+1} notified successfully")
             except Exception as e:
-                logger.error(f"Error notifying observer {i+1}: {e}", exc_info=True)
+                logger.error(f"Error notifying observer {i}: {e}", exc_info=True)
+        logger.info("Notified %d observers", count)
     
     def _load_config(self):
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    return json.load(f)
+                return _load_json(self.config_file)
             return {"webhooks": [], "scheduled_tasks": []}
         except Exception as e:
             logger.error(f"Error loading config: {e}")
@@ -120,43 +321,108 @@ class ConfigManager:
         """Load credentials from file."""
         try:
             if os.path.exists(self.credentials_file):
-                with open(self.credentials_file, "r") as f:
-                    return json.load(f)
+                return _load_json(self.credentials_file)
             return {}
         except Exception as e:
             logger.error(f"Error loading credentials: {e}")
             return {}
     
     def _save_config(self):
-        """Save configuration to file."""
-        try:
-            logger.info(f"Saving config to {self.config_file}")
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            
-            # Count scheduled tasks before save
-            tasks_before = len(self.config.get("scheduled_tasks", []))
-            logger.info(f"Config has {tasks_before} scheduled tasks before save")
-            
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
-            
-            # Verify the save by reading back the file
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    saved_config = json.load(f)
-                    tasks_after = len(saved_config.get("scheduled_tasks", []))
-                    logger.info(f"Saved config has {tasks_after} scheduled tasks")
-            
-            logger.info(f"Config saved successfully to {self.config_file}")
-        except Exception as e:
-            logger.error(f"Error saving config: {e}", exc_info=True)
+        """Queue the current configuration to be written to file."""
+        logger.info(f"Saving config to {self.config_file}")
+        self._queue_save(persistable_copy(self.config), None)
+    
+    def save_config_text(self, text):
+        """
+        Queue config file contents encoded by the caller to be written to file.
+        
+        Like other saves, the write happens on the background writer and
+        supersedes any queued write.
+        
+        Args:
+            text: Config file contents, encoding the current config
+        """
+        self._queue_save(None, text)
+    
+    def _queue_save(self, snapshot, text):
+        """
+        Queue a config snapshot or encoded config text for the background writer.
+        
+        Args:
+            snapshot: Config data to encode and write, or None if text is given
+            text: Encoded config file contents, or None
+        """
+        with self._save_lock:
+            # Drop a write that has not happened yet; the new one supersedes it
+            try:
+                self._save_queue.get_nowait()
+                self._save_queue.task_done()
+            except queue.Empty:
+                pass
+            self._save_seq += 1
+            self._save_queue.put_nowait((self._save_seq, snapshot, text))
+    
+    def _save_worker(self):
+        """Write queued config snapshots and text to file."""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                # Sentinel queued by close()
+                self._save_queue.task_done()
+                return
+            seq, snapshot, text = item
+            try:
+                with self._write_lock:
+                    if seq <= self._superseded_seq:
+                        continue
+                    if text is None:
+                        text = json_text(snapshot)
+                    _atomic_write_text(self.config_file, text)
+                logger.info("Config saved successfully to %s", self.config_file)
+            except Exception as e:
+                logger.error(f"Error saving config: {e}", exc_info=True)
+            finally:
+                self._save_queue.task_done()
+    
+    def write_config(self, encode, fsync=False):
+        """
+        Write the current configuration to file now, on the calling thread.
+        
+        Snapshots queued or being written by the background writer were taken
+        earlier, so they are dropped or finish first and never overwrite this write.
+        
+        Args:
+            encode: Function returning the file contents for the config data
+            fsync: Whether to wait for the new contents to reach the disk
+        """
+        with self._save_lock:
+            self._superseded_seq = self._save_seq
+        text = encode(self.config)
+        with self._write_lock:
+            _atomic_write_text(self.config_file, text, fsync)
+    
+    def flush(self):
+        """Wait until all queued config writes have reached the file."""
+        self._save_queue.join()
+    
+    def close(self):
+        """
+        Write any queued config and stop the background writer.
+        
+        The manager must not be used to change the config afterwards.
+        """
+        if self._save_thread is None:
+            return
+        self.flush()
+        self._save_queue.put(None)
+        self._save_thread.join()
+        self._save_thread = None
+        atexit.unregister(self.flush)
     
     def _save_credentials(self):
         """Save credentials to file."""
         try:
-            os.makedirs(os.path.dirname(self.credentials_file), exist_ok=True)
-            with open(self.credentials_file, "w") as f:
-                json.dump(self.credentials, f, indent=4)
+            _atomic_write_json(self.credentials_file, self.credentials)
         except Exception as e:
             logger.error(f"Error saving credentials: {e}")
     
@@ -169,6 +435,9 @@ class ConfigManager:
 class DialogHelper:
     """Helper class for creating dialogs."""
     
+    # Hidden webhook dialogs kept for reuse, by parent widget path
+    _webhook_dialogs = {}
+    
     @staticmethod
     def create_dialog(parent, title, fields, width=300, height=None):
         """
@@ -221,6 +490,8 @@ class DialogHelper:
         """
         Create a comprehensive webhook dialog.
         
+        The dialog is reused by later calls, so close it with close_dialog.
+        
         Args:
             parent: Parent window
             title: Dialog title
@@ -229,11 +500,23 @@ class DialogHelper:
         Returns:
             tuple: (dialog, form_data)
         """
+        # Reuse the hidden dialog from a previous call when there is one
+        cached = DialogHelper._webhook_dialogs.get(str(parent))
+        if cached and cached[0].winfo_exists() and cached[0].state() == "withdrawn":
+            dialog, form_data = cached
+            dialog.title(title)
+            form_data["name_var"].set(webhook.get("name", "") if webhook else "")
+            form_data["url_var"].set(webhook.get("url", "") if webhook else "")
+            dialog.deiconify()
+            dialog.grab_set()
+            return dialog, form_data
+        
         dialog = tk.Toplevel(parent)
         dialog.title(title)
         dialog.transient(parent)
         dialog.grab_set()
         dialog.geometry("450x300")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: DialogHelper.close_dialog(dialog))
         
         # Create a main frame with padding
         main_frame = ttk.Frame(dialog, padding=10)
@@ -278,8 +561,25 @@ class DialogHelper:
             "url_entry": url_entry
         }
         
+        if not cached or not cached[0].winfo_exists():
+            DialogHelper._webhook_dialogs[str(parent)] = (dialog, form_data)
+        
         return dialog, form_data
     
+    @staticmethod
+    def close_dialog(dialog):
+        """
+        Close a dialog, hiding it instead if it is kept for reuse.
+        
+        Args:
+            dialog: Dialog window
+        """
+        dialog.grab_release()
+        if any(cached[0] is dialog for cached in DialogHelper._webhook_dialogs.values()):
+            dialog.withdraw()
+        else:
+            dialog.destroy()
+    
     @staticmethod
     def add_button_frame(dialog, save_callback, cancel_callback):
         """
@@ -293,6 +593,14 @@ class DialogHelper:
         Returns:
             frame: Button frame
         """
+        # A reused dialog already has its buttons; point them at the new callbacks
+        buttons = getattr(dialog, "_dialog_buttons", None)
+        if buttons and buttons[0].winfo_exists():
+            button_frame, save_button, cancel_button = buttons
+            save_button.configure(command=save_callback)
+            cancel_button.configure(command=cancel_callback)
+            return button_frame
+        
         button_frame = ttk.Frame(dialog)
         
         # Check if we're adding to a grid or pack layout
@@ -301,8 +609,11 @@ class DialogHelper:
         else:
             button_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
             
-        ttk.Button(button_frame, text="Save", command=save_callback, width=10).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=cancel_callback, width=10).pack(side=tk.LEFT, padx=5)
+        save_button = ttk.Button(button_frame, text="Save", command=save_callback, width=10)
+        save_button.pack(side=tk.LEFT, padx=5)
+        cancel_button = ttk.Button(button_frame, text="Cancel", command=cancel_callback, width=10)
+        cancel_button.pack(side=tk.LEFT, padx=5)
+        dialog._dialog_buttons = (button_frame, save_button, cancel_button)
         
         return button_frame
 
@@ -350,8 +661,6 @@ class BaseUI(ABC):
             task: Function to run
             callback: Function to call with result
         """
-        import threading
-        
         def _run():
             try:
                 result = task()
@@ -360,7 +669,7 @@ class BaseUI(ABC):
                 logger.error(f"Error in async task: {e}")
                 self.parent.after(0, lambda: messagebox.showerror("Error", str(e)))
         
-        threading.Thread(target=_run).start()
+        _ASYNC_POOL.submit(_run)
     
     def create_scrollable_frame(self, parent):
         """
@@ -380,11 +689,23 @@ class BaseUI(ABC):
         scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        # Configure scrolling
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Configure scrolling, recomputing the scroll region once per burst of resize events
+        pending = [False]
+        last_bbox = [None]
+        
+        def _update_scrollregion():
+            pending[0] = False
+            bbox = canvas.bbox("all")
+            if bbox != last_bbox[0]:
+                last_bbox[0] = bbox
+                canvas.configure(scrollregion=bbox)
+        
+        def _on_configure(event):
+            if not pending[0]:
+                pending[0] = True
+                canvas.after_idle(_update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", _on_configure)
         
         # Add the scrollable frame to the canvas
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
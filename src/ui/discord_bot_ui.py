@@ -9,16 +9,26 @@ from tkinter import ttk
 import logging
 import os
 import json
+import importlib
 
-from .discord_tab import DiscordTab
-from .youtube_tab import YouTubeTab
-from .fetching_tab import FetchingTab
-from .api_config_tab import ApiConfigTab
-from .schedule_tab import ScheduleTab
 from .base_ui import StyleManager, ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Application directories
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_CONFIG_DIR = os.path.join(_BASE_DIR, "config")
+
+# Tabs in notebook order: (key, tab text, module, class name).
+# Tab modules pull in API clients, so each is imported when its tab is first shown.
+_TABS = (
+    ("DiscordTab", "Discord", ".discord_tab", "DiscordTab"),
+    ("YouTubeTab", "YouTube", ".youtube_tab", "YouTubeTab"),
+    ("FetchingTab", "Fetch Content", ".fetching_tab", "FetchingTab"),
+    ("ApiConfigTab", "API Config", ".api_config_tab", "ApiConfigTab"),
+    ("ScheduleTab", "Schedule", ".schedule_tab", "ScheduleTab"),
+)
+
 
 class DiscordBotUI:
     """Main UI for the Discord Webhook Bot."""
@@ -39,9 +49,7 @@ class DiscordBotUI:
         StyleManager.configure(style)
         
         # Initialize config manager
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        config_dir = os.path.join(base_dir, "config")
-        self.config_manager = ConfigManager(config_dir)
+        self.config_manager = ConfigManager(_CONFIG_DIR)
         
         # Create main notebook
         self.notebook = ttk.Notebook(self.root)
@@ -60,36 +68,46 @@ class DiscordBotUI:
         logger.info("Discord Bot UI initialized")
     
     def _create_tabs(self):
-        """Create and initialize all tabs."""
-        # Discord tab
-        discord_frame = ttk.Frame(self.notebook)
-        self.tabs["DiscordTab"] = DiscordTab(discord_frame, self.config_manager)
-        self.notebook.add(discord_frame, text="Discord")
-        
-        # YouTube tab
-        youtube_frame = ttk.Frame(self.notebook)
-        self.tabs["YouTubeTab"] = YouTubeTab(youtube_frame, self.config_manager)
-        self.notebook.add(youtube_frame, text="YouTube")
-        
-        # Fetching tab
-        fetching_frame = ttk.Frame(self.notebook)
-        fetching_tab = FetchingTab(fetching_frame, self.config_manager)
-        self.tabs["FetchingTab"] = fetching_tab
-        self.notebook.add(fetching_frame, text="Fetch Content")
-        
-        # API Config tab
-        api_config_frame = ttk.Frame(self.notebook)
-        self.tabs["ApiConfigTab"] = ApiConfigTab(api_config_frame, self.config_manager)
-        self.notebook.add(api_config_frame, text="API Config")
-        
-        # Schedule tab
-        schedule_frame = ttk.Frame(self.notebook)
-        self.tabs["ScheduleTab"] = ScheduleTab(schedule_frame, self.config_manager, fetching_tab)
-        self.notebook.add(schedule_frame, text="Schedule")
-        
-        # Select the first tab by default
+        """Create the notebook pages; each tab is built when first selected."""
+        self._tab_frames = {}
+        self._tab_specs = {}
+        for key, text, module_name, class_name in _TABS:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_frames[key] = frame
+            self._tab_specs[str(frame)] = (key, module_name, class_name)
+        
+        # Build and select the first tab by default
+        self._ensure_tab(_TABS[0][0])
         self.notebook.select(0)
     
+    def _ensure_tab(self, key):
+        """
+        Build a tab if it has not been built yet.
+        
+        Args:
+            key: Tab key from _TABS
+            
+        Returns:
+            Tab instance
+        """
+        tab = self.tabs.get(key)
+        if tab is not None:
+            return tab
+        
+        frame = self._tab_frames[key]
+        _, module_name, class_name = self._tab_specs[str(frame)]
+        tab_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        
+        if key == "ScheduleTab":
+            # The schedule tab reads fetched content from the fetching tab
+            tab = tab_class(frame, self.config_manager, self._ensure_tab("FetchingTab"))
+        else:
+            tab = tab_class(frame, self.config_manager)
+        self.tabs[key] = tab
+        logger.info(f"Created tab: {key}")
+        return tab
+    
     def _setup_events(self):
         """Set up event handlers."""
         # Tab change event
@@ -103,6 +121,9 @@ class DiscordBotUI:
         try:
             selected = self.notebook.select()
             if selected:
+                spec = self._tab_specs.get(str(selected))
+                if spec:
+                    self._ensure_tab(spec[0])
                 current_tab = self.notebook.tab(selected, "text")
                 logger.info(f"Switched to tab: {current_tab}")
                 
@@ -118,6 +139,10 @@ class DiscordBotUI:
     def _on_close(self):
         """Handle window close event."""
         logger.info("Closing application")
+        schedule_tab = self.tabs.get("ScheduleTab")
+        if schedule_tab is not None:
+            schedule_tab.save_pending_tasks(fsync=True)
+        self.config_manager.close()
         self.root.destroy()
     
     def _create_status_bar(self):
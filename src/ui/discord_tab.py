@@ -12,6 +12,27 @@ from .base_ui import BaseUI, DialogHelper
 
 logger = logging.getLogger(__name__)
 
+# ConnectorFactory, imported on first use so the API clients load only when needed
+_ConnectorFactory = None
+
+
+def _get_factory():
+    """
+    Get the connector factory class, importing it on first call.
+    
+    Returns:
+        ConnectorFactory class
+    """
+    global _ConnectorFactory
+    if _ConnectorFactory is None:
+        from src.api_connectors.factory import ConnectorFactory
+        _ConnectorFactory = ConnectorFactory
+    return _ConnectorFactory
+
+
+# Discord webhook URL: https://discord.com/api/webhooks/{webhook.id}/{webhook.token}
+_WEBHOOK_URL_RE = re.compile(r'^https://discord\.com/api/webhooks/(\d+)/([A-Za-z0-9_-]+)/?$')
+
 
 class WebhookValidator:
     """Validates Discord webhook data."""
@@ -36,9 +57,9 @@ class WebhookValidator:
             return False
         
         # Check if URL matches Discord webhook pattern
-        if not re.match(r'^https://discord\.com/api/webhooks/\d+/', webhook['url']):
+        if not _WEBHOOK_URL_RE.match(webhook['url']):
             messagebox.showerror("Validation Error", 
-                               "Invalid webhook URL. It should be in the format: https://discord.com/api/webhooks/...")
+                               "Invalid webhook URL. It should be in the format: https://discord.com/api/webhooks/{id}/{token}")
             return False
         
         return True
@@ -47,6 +68,9 @@ class WebhookValidator:
 class DiscordTab(BaseUI):
     """Discord tab UI component."""
     
+    # Discord connector shared by webhook tests; it holds no per-webhook state
+    _discord_connector = None
+    
     def __init__(self, parent, config_manager):
         """
         Initialize Discord tab.
@@ -55,6 +79,7 @@ class DiscordTab(BaseUI):
             parent: Parent notebook
             config_manager: Configuration manager instance
         """
+        self._saving_webhooks = False
         super().__init__(parent, config_manager, "Discord")
     
     def _init_ui(self):
@@ -97,24 +122,76 @@ class DiscordTab(BaseUI):
     
     def load_webhooks(self):
         """Load webhooks from config."""
-        # Clear existing items
-        for item in self.webhook_tree.get_children():
-            self.webhook_tree.delete(item)
+        # Clear existing items in a single call
+        children = self.webhook_tree.get_children()
+        if children:
+            self.webhook_tree.delete(*children)
         
         # Get webhooks from config
         webhooks = self.config_manager.config.get("webhooks", [])
+        self._webhooks = webhooks
         
         # If no webhooks found, show a message
         if not webhooks:
             self.webhook_tree.insert("", "end", values=("No webhooks configured", "", ""))
             return
         
-        # Add webhooks to tree
-        for webhook in webhooks:
-            name = webhook.get("name", "Unnamed Webhook")
-            url = webhook.get("url", "")
-            channel = webhook.get("channel", "")
-            self.webhook_tree.insert("", "end", values=(name, channel, url))
+        # Add webhooks to tree, using each webhook's index in the config as its row ID.
+        # The tree is unmapped while rows are added so its layout is recomputed once.
+        self.webhook_tree_frame.pack_forget()
+        insert = self.webhook_tree.insert
+        row_values = self._row_values
+        for i, webhook in enumerate(webhooks):
+            insert("", "end", iid=str(i), values=row_values(webhook))
+        self.webhook_tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    
+    @staticmethod
+    def _row_values(webhook):
+        """
+        Get the tree row values for a webhook.
+        
+        Args:
+            webhook: Webhook data
+            
+        Returns:
+            tuple: Row values
+        """
+        return (webhook.get("name", "Unnamed Webhook"), webhook.get("channel", ""), webhook.get("url", ""))
+    
+    def _save_webhooks(self, webhooks):
+        """
+        Save webhooks to config without reloading the tree.
+        
+        Args:
+            webhooks: Complete list of webhooks
+        """
+        self._saving_webhooks = True
+        try:
+            self.config_manager.update_config("webhooks", webhooks)
+        finally:
+            self._saving_webhooks = False
+    
+    def _selected_webhook_index(self, action):
+        """
+        Get the config index of the selected webhook.
+        
+        Args:
+            action: Action name used in the warning when nothing is selected
+            
+        Returns:
+            int: Webhook index, or None if no webhook is selected
+        """
+        selection = self.webhook_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", f"Please select a webhook to {action}")
+            return None
+        
+        # The "No webhooks configured" row has a generated, non-numeric ID
+        item = selection[0]
+        if not item.isdigit() or int(item) >= len(self._webhooks):
+            messagebox.showerror("Error", "Webhook not found in configuration")
+            return None
+        return int(item)
     
     def add_webhook(self):
         """Add a new webhook."""
@@ -133,33 +210,27 @@ class DiscordTab(BaseUI):
                 webhooks.append(webhook)
                 
                 # Update config
-                self.config_manager.update_config("webhooks", webhooks)
+                self._save_webhooks(webhooks)
                 
-                # Reload webhooks
-                self.load_webhooks()
-                dialog.destroy()
-        
-        DialogHelper.add_button_frame(dialog, save, dialog.destroy)
+                # Add just the new row, replacing the "No webhooks configured" row if shown
+                self._webhooks = webhooks
+                if len(webhooks) == 1:
+                    children = self.webhook_tree.get_children()
+                    if children:
+                        self.webhook_tree.delete(*children)
+                self.webhook_tree.insert("", "end", iid=str(len(webhooks) - 1), values=self._row_values(webhook))
+                DialogHelper.close_dialog(dialog)
+        
+        DialogHelper.add_button_frame(dialog, save, lambda: DialogHelper.close_dialog(dialog))
     
     def edit_webhook(self):
         """Edit selected webhook."""
-        selection = self.webhook_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a webhook to edit")
-            return
-        
         # Get selected webhook
-        item = selection[0]
-        values = self.webhook_tree.item(item, "values")
-        
-        # Get webhook data from config
-        webhooks = self.config_manager.config.get("webhooks", [])
-        webhook_index = next((i for i, w in enumerate(webhooks) if w["name"] == values[0]), None)
-        
+        webhook_index = self._selected_webhook_index("edit")
         if webhook_index is None:
-            messagebox.showerror("Error", "Webhook not found in configuration")
             return
         
+        webhooks = self._webhooks
         webhook = webhooks[webhook_index]
         
         # Create comprehensive dialog
@@ -176,54 +247,42 @@ class DiscordTab(BaseUI):
             updated_webhook = {"name": name, "url": url}
             if WebhookValidator.validate_webhook(updated_webhook):
                 webhooks[webhook_index] = updated_webhook
-                self.config_manager.update_config("webhooks", webhooks)
-                self.load_webhooks()
-                dialog.destroy()
+                self._save_webhooks(webhooks)
+                
+                # Update just the edited row
+                self.webhook_tree.item(str(webhook_index), values=self._row_values(updated_webhook))
+                DialogHelper.close_dialog(dialog)
         
-        DialogHelper.add_button_frame(dialog, save, dialog.destroy)
+        DialogHelper.add_button_frame(dialog, save, lambda: DialogHelper.close_dialog(dialog))
     
     def remove_webhook(self):
         """Remove selected webhook."""
-        selection = self.webhook_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a webhook to remove")
+        # Get selected webhook
+        webhook_index = self._selected_webhook_index("remove")
+        if webhook_index is None:
             return
         
         # Confirm deletion
         if not messagebox.askyesno("Confirm Deletion", "Are you sure you want to remove this webhook?"):
             return
         
-        # Get selected webhook
-        item = selection[0]
-        values = self.webhook_tree.item(item, "values")
-        
         # Remove webhook from config
-        webhooks = self.config_manager.config.get("webhooks", [])
-        webhooks = [w for w in webhooks if w["name"] != values[0]]
-        self.config_manager.update_config("webhooks", webhooks)
+        webhooks = self._webhooks
+        del webhooks[webhook_index]
+        self._save_webhooks(webhooks)
         
-        # Reload webhooks
+        # Reload webhooks once, since the row IDs after the removed one have shifted
         self.load_webhooks()
     
     def test_webhook(self):
         """Test selected webhook."""
-        selection = self.webhook_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a webhook to test")
-            return
-        
         # Get selected webhook
-        item = selection[0]
-        values = self.webhook_tree.item(item, "values")
-        
-        # Get webhook data from config
-        webhooks = self.config_manager.config.get("webhooks", [])
-        webhook = next((w for w in webhooks if w["name"] == values[0]), None)
-        
-        if webhook is None:
-            messagebox.showerror("Error", "Webhook not found in configuration")
+        webhook_index = self._selected_webhook_index("test")
+        if webhook_index is None:
             return
         
+        webhook = self._webhooks[webhook_index]
+        
         self._test_webhook(webhook["url"], webhook["name"])
     
     def _test_webhook(self, url, name):
@@ -234,9 +293,10 @@ class DiscordTab(BaseUI):
             url: Webhook URL
             name: Webhook name
         """
-        # Create connector
-        from src.api_connectors.factory import ConnectorFactory
-        connector = ConnectorFactory.create_connector("discord", {})
+        # Create connector once and reuse it for later tests
+        if DiscordTab._discord_connector is None:
+            DiscordTab._discord_connector = _get_factory().create_connector("discord", {})
+        connector = DiscordTab._discord_connector
         
         # Update status
         self.status_var.set(f"Testing webhook: {name}")
@@ -269,4 +329,7 @@ class DiscordTab(BaseUI):
     
     def on_config_changed(self):
         """Called when configuration changes."""
+        # The tree is already up to date after this tab's own saves
+        if self._saving_webhooks:
+            return
         self.load_webhooks()
@@ -8,8 +8,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 from .base_ui import BaseUI
-from .youtube_tab import YouTubeTab
-from .reddit_tab import RedditTab
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +25,10 @@ class FetchingTab(BaseUI):
         """
         self.current_platform = None
         self.platform_frames = {}
+        self._content_getters = {
+            "YouTube": self._get_youtube_content,
+            "Reddit": self._get_reddit_content
+        }
         self.youtube_content = []
         self.reddit_content = []
         
@@ -66,42 +68,45 @@ class FetchingTab(BaseUI):
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=2)
     
     def _create_platform_frames(self):
-        """Create frames for each platform."""
-        # YouTube frame - embedding YouTube tab functionality
+        """Register builders for each platform's frame; frames are built when first shown."""
+        self._platform_factories = {
+            "YouTube": self._build_youtube,
+            "Reddit": self._build_reddit
+        }
+    
+    def _build_youtube(self):
+        """Build the YouTube frame, embedding YouTube tab functionality."""
+        from .youtube_tab import YouTubeTab
+        
         youtube_frame = ttk.Frame(self.content_frame)
         youtube_ui = YouTubeTab(youtube_frame, self.config_manager)
         youtube_ui.frame.pack(fill=tk.BOTH, expand=True)
         
-        # Store reference to YouTube UI and its original display_results method
+        # Store reference to YouTube UI
         self.platform_frames["YouTube"] = {
             "frame": youtube_frame, 
             "ui": youtube_ui
         }
         
-        # Replace the display_results method
-        original_yt_display = youtube_ui._display_results
-        def youtube_display_wrapper(videos):
-            self.youtube_content = videos
-            return original_yt_display(videos)
-        youtube_ui._display_results = youtube_display_wrapper
+        # Keep the latest results
+        youtube_ui.on_results = lambda videos: setattr(self, "youtube_content", videos)
+    
+    def _build_reddit(self):
+        """Build the Reddit frame, embedding Reddit tab functionality."""
+        from .reddit_tab import RedditTab
         
-        # Reddit frame - embedding Reddit tab functionality
         reddit_frame = ttk.Frame(self.content_frame)
         reddit_ui = RedditTab(reddit_frame, self.config_manager)
         reddit_ui.frame.pack(fill=tk.BOTH, expand=True)
         
-        # Store reference to Reddit UI and its original display_results method
+        # Store reference to Reddit UI
         self.platform_frames["Reddit"] = {
             "frame": reddit_frame, 
             "ui": reddit_ui
         }
         
-        # Replace the display_results method
-        original_reddit_display = reddit_ui._update_results
-        def reddit_display_wrapper():
-            self.reddit_content = reddit_ui.results
-            return original_reddit_display()
-        reddit_ui._update_results = reddit_display_wrapper
+        # Keep the latest results
+        reddit_ui.on_results = lambda results: setattr(self, "reddit_content", results)
     
     def _show_platform_frame(self, platform):
         """
@@ -110,13 +115,22 @@ class FetchingTab(BaseUI):
         Args:
             platform: Platform name
         """
+        frames = self.platform_frames
+        
         # Hide all frames
-        for p, frame_data in self.platform_frames.items():
+        for frame_data in frames.values():
             frame_data["frame"].pack_forget()
         
+        # Build the selected platform's frame on first use
+        if platform not in frames:
+            factory = self._platform_factories.get(platform)
+            if factory:
+                factory()
+        
         # Show the selected platform's frame
-        if platform in self.platform_frames:
-            self.platform_frames[platform]["frame"].pack(fill=tk.BOTH, expand=True)
+        frame_data = frames.get(platform)
+        if frame_data:
+            frame_data["frame"].pack(fill=tk.BOTH, expand=True)
             self.current_platform = platform
     
     def _on_platform_changed(self, event):
@@ -139,26 +153,37 @@ class FetchingTab(BaseUI):
         Returns:
             List of content items
         """
-        if platform is None:
-            platform = self.current_platform
-        
-        if platform == "YouTube":
-            # Get selected videos from the YouTube UI
-            youtube_ui = self.platform_frames.get("YouTube", {}).get("ui")
-            if youtube_ui:
-                # First check for selected videos
-                if hasattr(youtube_ui, "selected_videos") and youtube_ui.selected_videos:
-                    logger.info(f"Returning {len(youtube_ui.selected_videos)} selected videos from YouTube tab")
-                    return youtube_ui.selected_videos
-                # If no selected videos, return all videos
-                if hasattr(youtube_ui, "videos") and youtube_ui.videos:
-                    logger.info(f"No selected videos, returning {len(youtube_ui.videos)} videos from YouTube tab")
-                    return youtube_ui.videos
-            
-            # Last resort: return cached content
-            logger.info(f"Using cached YouTube content: {len(self.youtube_content)}")
-            return self.youtube_content
-        elif platform == "Reddit":
-            return self.reddit_content
+        getter = self._content_getters.get(platform or self.current_platform)
+        return getter() if getter else []
+    
+    def _get_youtube_content(self):
+        """
+        Get content fetched from YouTube.
+        
+        Returns:
+            Selected videos, else all search results, else the cached results
+        """
+        frame_data = self.platform_frames.get("YouTube")
+        if frame_data:
+            youtube_ui = frame_data["ui"]
+            # First check for selected videos
+            if youtube_ui.selected_videos:
+                logger.info(f"Returning {len(youtube_ui.selected_videos)} selected videos from YouTube tab")
+                return youtube_ui.selected_videos
+            # If no selected videos, return all videos
+            if youtube_ui.videos:
+                logger.info(f"No selected videos, returning {len(youtube_ui.videos)} videos from YouTube tab")
+                return youtube_ui.videos
+        
+        # Last resort: return cached content
+        logger.info(f"Using cached YouTube content: {len(self.youtube_content)}")
+        return self.youtube_content
+    
+    def _get_reddit_content(self):
+        """
+        Get content fetched from Reddit.
         
-        return []
+        Returns:
+            Latest Reddit results
+        """
+        return self.reddit_content
@@ -8,11 +8,43 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from .base_ui import BaseUI
-import threading
+from src.api_connectors.factory import ConnectorFactory
+from src.utils.cache import get_config_cache
 
 logger = logging.getLogger(__name__)
 
+# Single long-lived worker for Reddit searches, so searches reuse one thread and run one at a time
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reddit-search")
+
+# Rows inserted into the results tree per UI event loop pass
+_RENDER_BATCH_SIZE = 100
+
+# Result fields shown in the results tree, in column order
+_TREE_COLUMNS = ("title", "subreddit", "author", "upvotes", "comments", "type")
+
+# Result fields kept as columns for rendering and tree actions
+_RESULT_COLUMNS = _TREE_COLUMNS + ("permalink",)
+
+# Recent search results are cached on disk by search parameters. Hot/new listings and
+# keyword searches change quickly; top listings for a time period change slowly.
+_DEFAULT_TTL = 60
+_TOP_TTL = 600
+
+
+def _cache_key(params):
+    """
+    Get the results cache key for search parameters.
+    
+    Args:
+        params: Search parameters
+        
+    Returns:
+        tuple: Hashable cache key
+    """
+    return tuple(sorted(params.items()))
+
 
 class RedditSearchOptions:
     """Container for Reddit search options."""
@@ -41,6 +73,12 @@ class RedditSearchOptions:
 class RedditTab(BaseUI):
     """Tab for searching and posting Reddit content."""
     
+    # Reddit connector for the current credentials, keyed by credential values
+    _connector_cache = {}
+    
+    # Discord connector shared by sends; it holds no per-webhook state
+    _discord_connector = None
+    
     def __init__(self, parent, config_manager):
         """
         Initialize the Reddit tab.
@@ -49,9 +87,59 @@ class RedditTab(BaseUI):
             parent: Parent widget
             config_manager: Configuration manager
         """
-        super().__init__(parent, config_manager, "Reddit")
+        # Optional callback called with each new list of search results
+        self.on_results = None
+        # Incremented on each render so batches from an earlier render stop
+        self._render_generation = 0
+        # Cache key of the search currently running, if any
+        self._inflight_key = None
+        # Webhooks by name, built on first send and cleared when the config changes
+        self._webhook_index = {}
         self.results = []
-        self._init_ui()
+        # Result fields by name, one list per field, indexed like self.results
+        self._cols = {name: [] for name in _RESULT_COLUMNS}
+        self._results_cache = get_config_cache(config_manager, "reddit")
+        super().__init__(parent, config_manager, "Reddit")
+        
+        # Create the connector before the first search, on the search worker so a
+        # search started meanwhile waits for it instead of creating another
+        credentials = config_manager.credentials.get("reddit", {})
+        if credentials.get("client_id") and credentials.get("client_secret"):
+            _SEARCH_EXECUTOR.submit(self._prewarm_connector, credentials)
+    
+    @classmethod
+    def _get_connector(cls, credentials):
+        """
+        Get the Reddit connector for the given credentials.
+        
+        The connector (and its authenticated client) is reused while the credentials are unchanged.
+        
+        Args:
+            credentials: Reddit API credentials
+            
+        Returns:
+            RedditConnector: Reddit connector
+        """
+        connector_key = (credentials.get("client_id"), credentials.get("client_secret"), credentials.get("user_agent"))
+        reddit = cls._connector_cache.get(connector_key)
+        if reddit is None:
+            reddit = ConnectorFactory.create_connector("reddit", credentials)
+            cls._connector_cache.clear()
+            cls._connector_cache[connector_key] = reddit
+        return reddit
+    
+    @classmethod
+    def _prewarm_connector(cls, credentials):
+        """
+        Create the Reddit connector in the background.
+        
+        Args:
+            credentials: Reddit API credentials
+        """
+        try:
+            cls._get_connector(credentials)
+        except Exception as e:
+            logger.warning(f"Could not create Reddit connector: {e}")
     
     def _init_ui(self):
         """Initialize the UI components."""
@@ -85,6 +173,8 @@ class RedditTab(BaseUI):
         ttk.Label(self.subreddit_frame, text="Subreddit:").pack(side=tk.LEFT, padx=5)
         self.subreddit_var = tk.StringVar()
         ttk.Entry(self.subreddit_frame, textvariable=self.subreddit_var, width=30).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.subreddit_frame, text="(combine with +, e.g. python+learnpython)",
+                  foreground="#555555").pack(side=tk.LEFT, padx=5)
         
         # Sort options
         sort_frame = ttk.Frame(self.subreddit_frame)
@@ -127,7 +217,12 @@ class RedditTab(BaseUI):
         max_results_dropdown.pack(side=tk.LEFT, padx=5)
         
         # Search button
-        ttk.Button(results_frame, text="Search", command=self._search_reddit).pack(side=tk.RIGHT, padx=5)
+        self.search_button = ttk.Button(results_frame, text="Search", command=self._search_reddit)
+        self.search_button.pack(side=tk.RIGHT, padx=5)
+        
+        # Skip cached results for the next search
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(results_frame, text="Force refresh", variable=self.force_refresh_var).pack(side=tk.RIGHT, padx=5)
         
         # Results frame
         results_frame = ttk.LabelFrame(main_frame, text="Results")
@@ -143,10 +238,18 @@ class RedditTab(BaseUI):
             ("type", "Type", 80)
         ]
         
-        self.results_tree, _ = self.create_treeview(results_frame, columns)
+        results_tree_frame, self.results_tree = self.create_treeview(results_frame, columns)
+        results_tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.results_tree.bind("<Double-1>", self._on_result_double_click)
         self.results_tree.bind("<Button-3>", self._on_result_right_click)
         
+        # Context menu for results
+        self._context_menu = tk.Menu(self.frame, tearoff=0)
+        self._context_menu.add_command(label="Open in Browser", command=self._open_in_browser)
+        self._context_menu.add_command(label="Send to Discord", command=self._send_to_discord)
+        self._context_menu.add_separator()
+        self._context_menu.add_command(label="Copy URL", command=self._copy_url)
+        
         # Initial UI state setup
         self._toggle_search_type()
     
@@ -165,17 +268,15 @@ class RedditTab(BaseUI):
         """Search Reddit based on selected options."""
         search_type = self.search_type_var.get()
         
-        # Clear existing results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
         # Setup search params
         params = {
             "limit": self.max_results_var.get()
         }
         
         if search_type == "subreddit":
-            subreddit = self.subreddit_var.get().strip()
+            # Several subreddits joined with "+" are fetched in a single request
+            names = (name.strip() for name in self.subreddit_var.get().split("+"))
+            subreddit = "+".join(name[2:] if name.lower().startswith("r/") else name for name in names if name)
             if not subreddit:
                 messagebox.showerror("Error", "Please enter a subreddit name")
                 return
@@ -201,161 +302,289 @@ class RedditTab(BaseUI):
             
             params["query"] = query
         
+        # Ignore repeated clicks while the same search is still running
+        key = _cache_key(params)
+        if key == self._inflight_key:
+            return
+        self._inflight_key = key
+        self.search_button.state(["disabled"])
+        
         # Start search in background
-        threading.Thread(target=self._do_search, args=(params,), daemon=True).start()
+        _SEARCH_EXECUTOR.submit(self._do_search, params, self.force_refresh_var.get())
+    
+    def _search_finished(self):
+        """Allow new searches once the running one has finished."""
+        self._inflight_key = None
+        self.search_button.state(["!disabled"])
     
-    def _do_search(self, params):
+    def _do_search(self, params, force_refresh=False):
         """
-        Perform the search in a background thread.
+        Perform the search on the search worker thread.
         
         Args:
             params: Search parameters
+            force_refresh: Whether to fetch again even if recent results are cached
         """
         try:
+            # Use recent results for the same search when available
+            key = _cache_key(params)
+            if force_refresh:
+                self._results_cache.delete(key)
+            cached = self._results_cache.get(key)
+            if cached is not None:
+                logger.info(f"Using cached Reddit results for {params}")
+                self.frame.after(0, self._update_results, cached, self._columns(cached))
+                return
+            
             # Get credentials
             credentials = self.config_manager.credentials.get("reddit", {})
             
             if not credentials.get("client_id") or not credentials.get("client_secret"):
-                messagebox.showerror("Error", "Reddit API credentials not configured. Please go to the API Config tab.")
+                self._show_error("Reddit API credentials not configured. Please go to the API Config tab.")
                 return
             
-            from src.api_connectors.factory import ConnectorFactory
-            reddit = ConnectorFactory.create_connector("reddit", credentials)
-            
             # Perform search
+            reddit = self._get_connector(credentials)
             results = reddit.fetch(**params)
-            self.results = results
+            self._prepare_results(results)
+            self._results_cache.set(key, results, _TOP_TTL if params.get("time_filter") else _DEFAULT_TTL)
             
             # Update UI in main thread
-            self.frame.after(0, self._update_results)
+            self.frame.after(0, self._update_results, results, self._columns(results))
             
         except Exception as e:
             logger.error(f"Error searching Reddit: {e}")
-            messagebox.showerror("Error", f"Error searching Reddit: {str(e)}")
+            self._show_error(f"Error searching Reddit: {str(e)}")
+        finally:
+            self.frame.after(0, self._search_finished)
     
-    def _update_results(self):
-        """Update the results treeview."""
-        # Clear existing results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Add results to treeview
-        for result in self.results:
-            values = (
-                result["title"],
-                result["subreddit"],
-                result["author"],
-                result["upvotes"],
-                result["comments"],
-                result["type"]
-            )
-            
+    def _show_error(self, message):
+        """
+        Show an error message box from a worker thread.
+        
+        Tk is not thread-safe, so the message box is shown by the UI thread.
+        
+        Args:
+            message: Error message
+        """
+        self.frame.after(0, messagebox.showerror, "Error", message)
+    
+    @staticmethod
+    def _prepare_results(results):
+        """
+        Add display fields to fetched results, off the UI thread.
+        
+        Args:
+            results: Fetched Reddit posts, updated in place
+        """
+        for result in results:
             # Add display text and source ID for scheduling
             result["display_text"] = f"Reddit - {result['title']} (r/{result['subreddit']})"
             result["source_id"] = result["permalink"]
             
-            self.results_tree.insert("", tk.END, values=values)
+            # Discord embed used when sending the post
+            result["_embed_base"] = RedditTab._build_embed(result)
     
-    def _on_result_double_click(self, event):
-        """Handle double-click on a result."""
-        # Get selected item
-        selected = self.results_tree.selection()
-        if not selected:
+    @staticmethod
+    def _columns(results):
+        """
+        Split results into one list per displayed field.
+        
+        Args:
+            results: Fetched Reddit posts
+            
+        Returns:
+            dict: Field name to list of values, indexed like results
+        """
+        return {name: [result[name] for result in results] for name in _RESULT_COLUMNS}
+    
+    @staticmethod
+    def _build_embed(result):
+        """
+        Build the Discord embed for a Reddit post.
+        
+        Args:
+            result: Reddit post
+            
+        Returns:
+            dict: Discord embed
+        """
+        embed = {
+            "title": result["title"],
+            "url": result["permalink"],
+            "color": 0xFF4500,  # Reddit orange
+            "author": {
+                "name": f"u/{result['author']} in r/{result['subreddit']}",
+                "url": f"https://www.reddit.com/user/{result['author']}"
+            },
+            "footer": {
+                "text": f"👍 {result['upvotes']} | 💬 {result['comments']}"
+            }
+        }
+        
+        # Add image if present
+        if result.get("type") == "image" and result.get("image"):
+            embed["image"] = {"url": result["image"]}
+        
+        # Add description for text posts
+        if result.get("type") == "text" and result.get("text"):
+            embed["description"] = result["text"][:2000]  # Discord max is 2048
+        
+        return embed
+    
+    def _update_results(self, results, cols):
+        """
+        Show new results in the results treeview.
+        
+        Args:
+            results: Fetched Reddit posts
+            cols: Result fields from _columns
+        """
+        self.results = results
+        self._cols = cols
+        if self.on_results:
+            self.on_results(self.results)
+        
+        # Clear existing results in a single call
+        children = self.results_tree.get_children()
+        if children:
+            self.results_tree.delete(*children)
+        
+        # Add results to treeview in batches so large result sets don't block the UI
+        self._render_generation += 1
+        self._insert_result_rows(0, self._render_generation)
+    
+    def _insert_result_rows(self, start, generation):
+        """
+        Insert a batch of result rows, scheduling the next batch if there are more.
+        
+        Args:
+            start: Index of the first result to insert
+            generation: Render generation the batch belongs to
+        """
+        if generation != self._render_generation:
             return
         
-        # Get index of selected item
-        index = self.results_tree.index(selected[0])
-        if index < len(self.results):
+        end = start + _RENDER_BATCH_SIZE
+        insert = self.results_tree.insert
+        rows = zip(*(self._cols[name][start:end] for name in _TREE_COLUMNS))
+        for i, row in enumerate(rows, start):
+            # The row ID is the result's index in self.results
+            insert("", tk.END, iid=str(i), values=row)
+        
+        if end < len(self.results):
+            self.frame.after(1, self._insert_result_rows, end, generation)
+    
+    def _on_result_double_click(self, event):
+        """Handle double-click on a result."""
+        permalink = self._selected_permalink()
+        if permalink:
             # Open in browser
-            webbrowser.open(self.results[index]["permalink"])
+            webbrowser.open(permalink)
     
     def _on_result_right_click(self, event):
         """Show context menu on right-click."""
-        # Get selection
-        selected = self.results_tree.selection()
-        if not selected:
-            return
-        
-        # Create context menu
-        context_menu = tk.Menu(self.frame, tearoff=0)
-        context_menu.add_command(label="Open in Browser", command=self._open_in_browser)
-        context_menu.add_command(label="Send to Discord", command=self._send_to_discord)
-        context_menu.add_separator()
-        context_menu.add_command(label="Copy URL", command=self._copy_url)
-        
-        # Show menu
-        context_menu.post(event.x_root, event.y_root)
+        if self.results_tree.selection():
+            self._context_menu.tk_popup(event.x_root, event.y_root)
     
     def _open_in_browser(self):
         """Open selected result in browser."""
+        permalink = self._selected_permalink()
+        if permalink:
+            webbrowser.open(permalink)
+    
+    def _selected_result(self):
+        """
+        Get the selected result.
+        
+        Returns:
+            dict: Selected result, or None if nothing is selected
+        """
         selected = self.results_tree.selection()
         if not selected:
-            return
+            return None
+        return self.results[int(selected[0])]
+    
+    def _selected_permalink(self):
+        """
+        Get the URL of the selected result.
+        
+        Returns:
+            str: Selected result's permalink, or None if nothing is selected
+        """
+        selected = self.results_tree.selection()
+        if not selected:
+            return None
+        return self._cols["permalink"][int(selected[0])]
+    
+    def _all_webhooks(self):
+        """
+        Get the configured webhooks.
         
-        index = self.results_tree.index(selected[0])
-        if index < len(self.results):
-            webbrowser.open(self.results[index]["permalink"])
+        Returns:
+            list: Webhooks from credentials, or from config.json if none are stored there
+        """
+        webhooks = self.config_manager.credentials.get("discord", {}).get("webhooks", [])
+        if not webhooks:
+            # For backward compatibility, check config.json
+            webhooks = self.config_manager.config.get("webhooks", [])
+        return webhooks
+    
+    def on_config_changed(self):
+        """Called when configuration changes."""
+        self._webhook_index = {}
     
     def _send_to_discord(self):
         """Send selected result to Discord webhook."""
-        selected = self.results_tree.selection()
-        if not selected:
+        result = self._selected_result()
+        if result is None:
             return
         
-        index = self.results_tree.index(selected[0])
-        if index < len(self.results):
-            result = self.results[index]
-            
-            # Get webhooks
-            webhooks = self.config_manager.credentials.get("discord", {}).get("webhooks", [])
-            if not webhooks:
-                # For backward compatibility, check config.json
-                webhooks = self.config_manager.config.get("webhooks", [])
-                
-            if not webhooks:
-                messagebox.showerror("Error", "No webhooks configured. Please go to the Discord tab.")
-                return
-            
-            # Create dialog to select webhook
-            from .base_ui import DialogHelper
-            dialog = tk.Toplevel(self.frame)
-            dialog.title("Send to Discord")
-            dialog.transient(self.frame)
-            dialog.grab_set()
-            
-            # Webhook selection
-            webhook_frame = ttk.Frame(dialog)
-            webhook_frame.pack(fill=tk.X, padx=10, pady=10)
-            
-            ttk.Label(webhook_frame, text="Webhook:").pack(side=tk.LEFT, padx=5)
-            webhook_var = tk.StringVar()
-            webhook_dropdown = ttk.Combobox(webhook_frame, textvariable=webhook_var, state="readonly", width=30)
-            webhook_dropdown["values"] = [w["name"] for w in webhooks]
-            webhook_dropdown.current(0)
-            webhook_dropdown.pack(side=tk.LEFT, padx=5)
-            
-            # Message customization
-            message_frame = ttk.LabelFrame(dialog, text="Message")
-            message_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            content_frame = ttk.Frame(message_frame)
-            content_frame.pack(fill=tk.X, padx=5, pady=5)
-            
-            ttk.Label(content_frame, text="Content:").pack(anchor=tk.W)
-            content_var = tk.StringVar(value=f"New post from r/{result['subreddit']}")
-            ttk.Entry(content_frame, textvariable=content_var, width=50).pack(fill=tk.X, pady=5)
-            
-            include_var = tk.BooleanVar(value=True)
-            ttk.Checkbutton(message_frame, text="Include post details", variable=include_var).pack(anchor=tk.W, padx=5)
-            
-            # Buttons
-            button_frame = ttk.Frame(dialog)
-            button_frame.pack(fill=tk.X, padx=10, pady=10)
-            
-            ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
-            ttk.Button(button_frame, text="Send", command=lambda: self._do_send_to_discord(
-                dialog, webhook_var.get(), content_var.get(), include_var.get(), result
-            )).pack(side=tk.RIGHT, padx=5)
+        # Get webhooks
+        webhooks = self._all_webhooks()
+        if not webhooks:
+            messagebox.showerror("Error", "No webhooks configured. Please go to the Discord tab.")
+            return
+        
+        # Create dialog to select webhook
+        dialog = tk.Toplevel(self.frame)
+        dialog.title("Send to Discord")
+        dialog.transient(self.frame)
+        dialog.grab_set()
+        
+        # Webhook selection
+        webhook_frame = ttk.Frame(dialog)
+        webhook_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Label(webhook_frame, text="Webhook:").pack(side=tk.LEFT, padx=5)
+        webhook_var = tk.StringVar()
+        webhook_dropdown = ttk.Combobox(webhook_frame, textvariable=webhook_var, state="readonly", width=30)
+        webhook_dropdown["values"] = [w["name"] for w in webhooks]
+        webhook_dropdown.current(0)
+        webhook_dropdown.pack(side=tk.LEFT, padx=5)
+        
+        # Message customization
+        message_frame = ttk.LabelFrame(dialog, text="Message")
+        message_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        content_frame = ttk.Frame(message_frame)
+        content_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(content_frame, text="Content:").pack(anchor=tk.W)
+        content_var = tk.StringVar(value=f"New post from r/{result['subreddit']}")
+        ttk.Entry(content_frame, textvariable=content_var, width=50).pack(fill=tk.X, pady=5)
+        
+        include_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(message_frame, text="Include post details", variable=include_var).pack(anchor=tk.W, padx=5)
+        
+        # Buttons
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Send", command=lambda: self._do_send_to_discord(
+            dialog, webhook_var.get(), content_var.get(), include_var.get(), result
+        )).pack(side=tk.RIGHT, padx=5)
     
     def _do_send_to_discord(self, dialog, webhook_name, content, include_details, result):
         """
@@ -370,20 +599,18 @@ class RedditTab(BaseUI):
         """
         try:
             # Get webhook URL
-            webhooks = self.config_manager.credentials.get("discord", {}).get("webhooks", [])
-            if not webhooks:
-                # For backward compatibility, check config.json
-                webhooks = self.config_manager.config.get("webhooks", [])
-            
-            webhook = next((w for w in webhooks if w["name"] == webhook_name), None)
+            if not self._webhook_index:
+                self._webhook_index = {w["name"]: w for w in self._all_webhooks()}
+            webhook = self._webhook_index.get(webhook_name)
             
             if not webhook:
                 messagebox.showerror("Error", "Selected webhook not found")
                 return
             
             # Get Discord connector
-            from src.api_connectors.factory import ConnectorFactory
-            discord = ConnectorFactory.create_connector("discord", {})
+            if RedditTab._discord_connector is None:
+                RedditTab._discord_connector = ConnectorFactory.create_connector("discord", {})
+            discord = RedditTab._discord_connector
             
             # Prepare message
             message = {
@@ -392,31 +619,7 @@ class RedditTab(BaseUI):
             }
             
             if include_details:
-                # Create embed for post
-                color = 0xFF4500  # Reddit orange
-                
-                embed = {
-                    "title": result["title"],
-                    "url": result["permalink"],
-                    "color": color,
-                    "author": {
-                        "name": f"u/{result['author']} in r/{result['subreddit']}",
-                        "url": f"https://www.reddit.com/user/{result['author']}"
-                    },
-                    "footer": {
-                        "text": f"👍 {result['upvotes']} | 💬 {result['comments']}"
-                    }
-                }
-                
-                # Add image if present
-                if result.get("type") == "image" and result.get("image"):
-                    embed["image"] = {"url": result["image"]}
-                
-                # Add description for text posts
-                if result.get("type") == "text" and result.get("text"):
-                    embed["description"] = result["text"][:2000]  # Discord max is 2048
-                
-                message["embeds"].append(embed)
+                message["embeds"].append(result["_embed_base"])
             
             # Send message
             discord.send_webhook_message(webhook["url"], **message)
@@ -433,15 +636,11 @@ class RedditTab(BaseUI):
     
     def _copy_url(self):
         """Copy selected result URL to clipboard."""
-        selected = self.results_tree.selection()
-        if not selected:
-            return
-        
-        index = self.results_tree.index(selected[0])
-        if index < len(self.results):
+        permalink = self._selected_permalink()
+        if permalink:
             # Copy to clipboard
             self.frame.clipboard_clear()
-            self.frame.clipboard_append(self.results[index]["permalink"])
+            self.frame.clipboard_append(permalink)
             
             # Show feedback
             messagebox.showinfo("Copied", "URL copied to clipboard")
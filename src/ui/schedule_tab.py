@@ -8,14 +8,309 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 import time as time_module  # Rename to avoid conflict
-import threading
-import json
+import atexit
+import itertools
+import re
+import textwrap
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, time
-from .base_ui import BaseUI
-import os
+from .base_ui import BaseUI, persistable_copy, json_text
+from src.utils.cache import get_config_cache
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool of long-lived workers for running tasks
+_TASK_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="task-run")
+atexit.register(_TASK_EXECUTOR.shutdown, wait=False)
+
+# Connectors used to run tasks, imported once; tasks report the error if they are unavailable
+try:
+    from src.api_connectors import get_connector
+    _CONNECTOR_IMPORT_ERROR = None
+except ImportError as e:
+    get_connector = None
+    _CONNECTOR_IMPORT_ERROR = e
+
+
+# Timestamps as written by datetime.isoformat, up to the minute
+_ISO_MINUTE_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
+
+def _set_display_fields(task):
+    """
+    Store the task's status and next run time formatted for the tasks tree.
+    
+    Call again whenever "enabled" or "next_run" changes. The underscore keys
+    are not saved to the config file.
+    
+    Args:
+        task: Task to update
+    """
+    task["_display_status"] = "Enabled" if task.get("enabled", True) else "Disabled"
+    
+    # Format next run time; only strings that start like "YYYY-MM-DDTHH:MM" are worth parsing
+    next_run = task.get("next_run") or ""
+    if len(next_run) >= 16 and next_run[4] == "-":
+        if _ISO_MINUTE_RE.match(next_run):
+            # Date, hour and minute can be sliced out of the string as they are
+            next_run = f"{next_run[:10]} {next_run[11:16]}"
+        else:
+            try:
+                next_run_dt = datetime.fromisoformat(next_run)
+                next_run = next_run_dt.strftime("%Y-%m-%d %H:%M")
+            except ValueError:
+                pass
+    task["_display_next_run"] = next_run
+
+
+# Rows inserted into the tasks tree per UI event loop pass
+_RENDER_BATCH_SIZE = 100
+
+# Saved JSON text of each task by id(), as (task, text); entries are dropped when a task changes
+_task_json_cache = {}
+
+
+def _task_changed(task):
+    """
+    Update the values derived from a task after it changes.
+    
+    Args:
+        task: Task that was added or modified
+    """
+    _set_display_fields(task)
+    _task_json_cache.pop(id(task), None)
+
+
+def _encode_task(task):
+    """
+    Encode a task as it appears inside the config file's task list.
+    
+    Args:
+        task: Task without underscore keys
+        
+    Returns:
+        str: JSON object indented by four spaces per level, starting at eight spaces
+    """
+    return textwrap.indent(json_text(task), " " * 8)
+
+
+def _tasks_json(tasks):
+    """
+    Get the JSON text of a task list as it appears inside the config file.
+    
+    Each task is encoded once and its text reused until _task_changed is called for it.
+    
+    Args:
+        tasks: Tasks to encode
+        
+    Returns:
+        str: JSON array, indented for the "scheduled_tasks" key of the config file
+    """
+    if not tasks:
+        return "[]"
+    
+    chunks = []
+    cache = {}
+    for task in tasks:
+        cached = _task_json_cache.get(id(task))
+        if cached is None or cached[0] is not task:
+            cached = (task, _encode_task(persistable_copy(task)))
+        cache[id(task)] = cached
+        chunks.append(cached[1])
+    
+    # Keep only the tasks still in the list
+    _task_json_cache.clear()
+    _task_json_cache.update(cache)
+    return "[\n" + ",\n".join(chunks) + "\n    ]"
+
+
+def _config_json(config):
+    """
+    Encode the config file, reusing the cached text of unchanged tasks.
+    
+    Args:
+        config: Config data
+        
+    Returns:
+        str: Config file contents, as json.dump with indent=4 writes them
+    """
+    tasks = config.get("scheduled_tasks")
+    if not tasks:
+        return json_text(persistable_copy(config))
+    
+    # Encode the rest of the config around an empty task list, then splice the tasks in.
+    # A newline cannot appear inside a JSON string, so the placeholder is unambiguous.
+    placeholder = '\n    "scheduled_tasks": []'
+    text = json_text(persistable_copy({**config, "scheduled_tasks": []}))
+    return text.replace(placeholder, '\n    "scheduled_tasks": ' + _tasks_json(tasks), 1)
+
+
+# Seconds that fetched items are reused by tasks with the same source
+_FETCH_TTL = 600
+
+# Most embeds Discord accepts in one webhook message
+_MAX_EMBEDS_PER_MESSAGE = 10
+
+# Seconds that items posted to a webhook are remembered, so they aren't posted again
+_POSTED_TTL = 30 * 24 * 60 * 60
+
+# Check marks shown in the first column of video lists
+_CHECKED_MARK = "\u2611"
+_UNCHECKED_MARK = "\u2610"
+
+@functools.lru_cache(maxsize=4096)
+def _published_date(published):
+    """
+    Format a published timestamp as a date for video lists.
+    
+    Results are cached, so reopening the task dialog doesn't parse the same
+    timestamps again.
+    
+    Args:
+        published: ISO 8601 timestamp, possibly ending in "Z"
+        
+    Returns:
+        str: The date as YYYY-MM-DD, or the timestamp unchanged if it can't be parsed
+    """
+    try:
+        return datetime.fromisoformat(published.replace('Z', '+00:00')).strftime("%Y-%m-%d")
+    except ValueError:
+        return published
+
+
+# Titles longer than this show their full text in a tooltip
+_TOOLTIP_TITLE_LENGTH = 50
+
+# Milliseconds that task saves are delayed so rapid changes are written once
+_SAVE_DELAY_MS = 500
+
+# Milliseconds that task list reloads after task runs are delayed, so tasks
+# finishing together reload the list once
+_REFRESH_DELAY_MS = 250
+
+
+def _short_description(description, length=200):
+    """
+    Shorten a description to at most length characters, marking cut text with "...".
+    
+    Args:
+        description: Description text
+        length: Maximum length
+        
+    Returns:
+        str: The description, shortened if needed
+    """
+    if len(description) <= length:
+        return description
+    return description[:length - 3] + "..."
+
+
+def _webhook_key(webhook_url):
+    """
+    Get the key that identifies a webhook in the posted items cache.
+    
+    The URL is hashed so the webhook's token is not written to the cache file.
+    
+    Args:
+        webhook_url: Discord webhook URL
+        
+    Returns:
+        str: Webhook key
+    """
+    return hashlib.sha256(webhook_url.encode()).hexdigest()[:16]
+
+
+def _new_items(items, posted, webhook_key):
+    """
+    Leave out repeated items and items already posted to a webhook.
+    
+    Items without an ID are always kept.
+    
+    Args:
+        items: Items to post
+        posted: Cache of posted items, keyed by (webhook_key, item ID)
+        webhook_key: Key of the webhook, from _webhook_key
+        
+    Returns:
+        list: Items to post, in their original order
+    """
+    new_items = []
+    seen = set()
+    for item in items:
+        item_id = item.get("id")
+        if item_id is not None:
+            if item_id in seen or posted.get((webhook_key, item_id)):
+                continue
+            seen.add(item_id)
+        new_items.append(item)
+    return new_items
+
+
+def _item_embed(item, source_name):
+    """
+    Build the Discord embed for a fetched item.
+    
+    Args:
+        item: Fetched or selected item
+        source_name: Platform name shown in the embed
+        
+    Returns:
+        dict: Discord embed
+    """
+    return {
+        "title": item.get("title", ""),
+        "description": _short_description(item.get("description") or ""),
+        "url": item.get("url", ""),
+        "color": 0x00ff00,  # Green
+        "thumbnail": {"url": item.get("thumbnail", "")},
+        "fields": [
+            {"name": "Source", "value": source_name, "inline": True},
+            {"name": "Published", "value": item.get("published", ""), "inline": True}
+        ]
+    }
+
+
+# Video fields stored with a task's selected videos
+_SAVED_VIDEO_FIELDS = ("id", "title", "url", "thumbnail", "published")
+
+
+def _saved_video(video):
+    """
+    Get the fields of a video that are stored with a task.
+    
+    Args:
+        video: Fetched video
+        
+    Returns:
+        dict: Stored video fields, empty strings for missing ones
+    """
+    get = video.get
+    return {field: get(field, "") for field in _SAVED_VIDEO_FIELDS}
+
+
+@dataclass
+class _TaskForm:
+    """Variables of the task dialog's input widgets."""
+    
+    platform_var: tk.StringVar
+    source_option_var: tk.StringVar
+    source_var: tk.StringVar
+    # Fetched videos and the indices of the checked ones, filled in as the videos load
+    videos: list
+    selected_videos: set
+    webhook_var: tk.StringVar
+    enabled_var: tk.BooleanVar
+    interval_value_var: tk.StringVar
+    interval_type_var: tk.StringVar
+    date_var: tk.StringVar
+    hour_var: tk.StringVar
+    minute_var: tk.StringVar
+    max_items_var: tk.StringVar
+    status_var: tk.StringVar
+
 
 class TasksTab(BaseUI):
     """Task management tab UI component."""
@@ -30,8 +325,25 @@ class TasksTab(BaseUI):
             fetching_tab: Reference to the fetching tab for content selection
         """
         self.fetching_tab = fetching_tab
+        # Suffix for new task IDs, so tasks added within the same second get distinct IDs
+        self._id_counter = itertools.count()
+        # Webhook names for the task dialog, built on first use and cleared when the config changes
+        self._webhook_names = None
+        # Webhooks by name for running tasks, built on first run and cleared when the config changes
+        self._webhooks_by_name = None
+        # Incremented on each load so batches from an earlier load stop
+        self._render_generation = 0
+        # After ID of the delayed task save, if one is pending
+        self._pending_save = None
+        # After ID of the delayed task list reload, if one is pending
+        self._pending_refresh = None
+        # Tooltip window shared by all video lists, created on first use
+        self._tooltip = None
+        self._tooltip_label = None
+        # Status message variable of the open task dialog
+        self._dialog_status_var = None
         super().__init__(parent, config_manager, "Tasks")
-        self._tasks = self.config.get("scheduled_tasks", [])
+        self.tasks = self.config.get("scheduled_tasks", [])
         
         # Create a status variable for this tab
         self.status_var = tk.StringVar(value="Ready")
@@ -53,6 +365,14 @@ class TasksTab(BaseUI):
     def tasks(self, value):
         """Set the tasks."""
         self._tasks = value
+        # Tasks by ID; the first task wins if IDs repeat. IDs are stored as strings,
+        # matching the tree row tags they are looked up by.
+        self._tasks_by_id = {}
+        for task in value:
+            task_id = task.get("id")
+            if task_id is not None and not isinstance(task_id, str):
+                task_id = task["id"] = str(task_id)
+            self._tasks_by_id.setdefault(task_id, task)
     
     def _init_ui(self):
         """Initialize the UI components. Required by BaseUI."""
@@ -126,40 +446,69 @@ class TasksTab(BaseUI):
         self.status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.grid(row=5, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
     
+    def _schedule_refresh(self):
+        """Reload the task list after a short delay, once for any changes made meanwhile."""
+        if self._pending_refresh is None:
+            self._pending_refresh = self.frame.after(_REFRESH_DELAY_MS, self._load_tasks)
+    
     def _load_tasks(self):
         """Load tasks from configuration."""
-        # Clear existing tasks
-        for item in self.tasks_tree.get_children():
-            self.tasks_tree.delete(item)
+        if self._pending_refresh is not None:
+            self.frame.after_cancel(self._pending_refresh)
+            self._pending_refresh = None
         
-        # Add tasks from config
-        for task in self._tasks:
-            status = "Enabled" if task.get("enabled", True) else "Disabled"
-            
-            # Format next run time
-            next_run = task.get("next_run", "")
-            if next_run:
-                try:
-                    next_run_dt = datetime.fromisoformat(next_run)
-                    next_run = next_run_dt.strftime("%Y-%m-%d %H:%M")
-                except ValueError:
-                    pass
+        # Hide the tree while it is rebuilt so it is redrawn once
+        tree = self.tasks_tree
+        tree.grid_remove()
+        
+        # Clear existing tasks in a single call
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        
+        # Add the first tasks now and the rest in batches, so long task lists don't block the UI
+        self._render_generation += 1
+        self._insert_task_rows(self._tasks, 0, self._render_generation)
+        
+        tree.grid()
+    
+    def _insert_task_rows(self, tasks, start, generation):
+        """
+        Insert a batch of task rows, scheduling the next batch if there are more.
+        
+        Args:
+            tasks: Tasks being loaded
+            start: Index of the first task to insert
+            generation: Render generation the batch belongs to
+        """
+        if generation != self._render_generation:
+            return
+        
+        end = start + _RENDER_BATCH_SIZE
+        insert = self.tasks_tree.insert
+        for task in tasks[start:end]:
+            # Display strings are formatted once per task and kept on it
+            if "_display_status" not in task:
+                _set_display_fields(task)
             
-            self.tasks_tree.insert("", tk.END, values=(
+            insert("", tk.END, values=(
                 task.get("id", ""),
                 task.get("platform", ""),
                 task.get("source", ""),
                 task.get("webhook", ""),
                 task.get("schedule", ""),
-                status,
-                next_run
-            ), tags=(task.get("id", "")))
+                task["_display_status"],
+                task["_display_next_run"]
+            ), tags=task.get("id", ""))
+        
+        if end < len(tasks):
+            self.frame.after(1, self._insert_task_rows, tasks, end, generation)
     
     def _refresh_tasks(self):
         """Refresh the tasks list from configuration."""
         logger.info("Refreshing task list")
         # Get fresh tasks from config
-        self._tasks = self.config_manager.config.get("scheduled_tasks", [])
+        self.tasks = self.config_manager.config.get("scheduled_tasks", [])
         # Reload the tasks into the UI
         self._load_tasks()
     
@@ -261,27 +610,34 @@ class TasksTab(BaseUI):
         
         # Add refresh button
         def refresh_videos():
+            nonlocal videos_frame, videos_populated
+            videos_populated = True
+            
             # Get the current platform
             current_platform = platform_var.get()
             
-            # Store the video status and tell user we're refreshing
+            # Store the video status and tell user we're refreshing; only redraw, so no other
+            # events (such as a second click on Refresh) are handled in the middle of the refresh
             video_status_var.set("Refreshing videos...")
-            add_window.update()
+            add_window.update_idletasks()
             
-            # Clear existing videos
-            for widget in videos_frame.winfo_children():
-                widget.destroy()
+            # Clear existing videos by replacing the frame, which destroys its children in one call
+            videos_frame.destroy()
+            videos_frame = ttk.Frame(videos_selection_frame)
+            videos_frame.pack(fill="both", expand=True, padx=5, pady=5, before=videos_header_frame)
             
-            # Clear video vars and frames
-            video_vars.clear()
-            video_frames.clear()
+            # Clear videos and their selection
+            videos.clear()
+            selected_videos.clear()
             
             # Populate with fresh videos
-            self._populate_fetched_videos(current_platform, videos_frame, video_status_var, video_vars, video_frames, task)
+            self._populate_fetched_videos(current_platform, videos_frame, video_status_var, videos, selected_videos, task)
         
-        # Create video checkboxes for selection
-        video_vars = []
-        video_frames = []
+        # Videos listed for selection and the indices of the checked ones
+        videos = []
+        selected_videos = set()
+        # Videos are fetched the first time the fetched source is shown
+        videos_populated = False
         
         # Add refresh button to header
         ttk.Button(videos_header_frame, text="Refresh Videos", command=refresh_videos).pack(side="right", padx=5)
@@ -295,8 +651,9 @@ class TasksTab(BaseUI):
             else:
                 manual_source_frame.pack_forget()
                 videos_selection_frame.pack(fill="both", expand=True, padx=5, pady=5)
-                # Populate videos
-                refresh_videos()
+                # Populate videos, unless they were already loaded; "Refresh Videos" reloads them
+                if not videos_populated:
+                    refresh_videos()
         
         # Set up toggle handlers
         source_option_var.trace_add("write", lambda *args: toggle_source_visibility())
@@ -312,12 +669,13 @@ class TasksTab(BaseUI):
         webhook_var = tk.StringVar(value=task.get("webhook", ""))
         
         # Get webhooks from config
-        webhooks = []
-        if hasattr(self, "config_manager"):
-            webhooks = self.config_manager.config.get("webhooks", [])
-        webhook_names = [w.get("name", "") for w in webhooks]
+        if self._webhook_names is None:
+            webhooks = []
+            if hasattr(self, "config_manager"):
+                webhooks = self.config_manager.config.get("webhooks", [])
+            self._webhook_names = [w.get("name", "") for w in webhooks]
         
-        webhook_combo = ttk.Combobox(webhook_frame, textvariable=webhook_var, values=webhook_names, state="readonly")
+        webhook_combo = ttk.Combobox(webhook_frame, textvariable=webhook_var, values=self._webhook_names, state="readonly")
         webhook_combo.pack(side="left", padx=5, pady=5)
         
         # Add scheduling options
@@ -387,129 +745,156 @@ class TasksTab(BaseUI):
         # Status and buttons
         status_var = tk.StringVar()
         ttk.Label(content_frame, textvariable=status_var, foreground="red").pack(pady=5)
+        self._dialog_status_var = status_var
         
         button_frame = ttk.Frame(content_frame)
         button_frame.pack(fill="x", padx=5, pady=10)
         
-        # Save function
-        def save_task():
-            try:
-                # Validate inputs
-                if source_option_var.get() == "manual" and not source_var.get().strip():
-                    status_var.set("Please enter a source")
-                    return
+        # Variables read when the task is saved
+        form = _TaskForm(
+            platform_var=platform_var,
+            source_option_var=source_option_var,
+            source_var=source_var,
+            videos=videos,
+            selected_videos=selected_videos,
+            webhook_var=webhook_var,
+            enabled_var=enabled_var,
+            interval_value_var=interval_value_var,
+            interval_type_var=interval_type_var,
+            date_var=date_var,
+            hour_var=hour_var,
+            minute_var=minute_var,
+            max_items_var=max_items_var,
+            status_var=status_var
+        )
+        
+        # Add buttons
+        ttk.Button(button_frame, text="Cancel", command=add_window.destroy).pack(side="right", padx=5)
+        ttk.Button(button_frame, text="Save", command=lambda: self._save_task(form, task, is_edit, add_window)).pack(side="right", padx=5)
+    
+    def _save_task(self, form, task, is_edit, add_window):
+        """
+        Save the task entered in the task dialog.
+        
+        Args:
+            form: Dialog variables
+            task: Task being edited, or an empty dict for a new task
+            is_edit: Whether this is editing an existing task
+            add_window: Dialog window, closed once the task is saved
+        """
+        try:
+            # Read the form once
+            source_option = form.source_option_var.get()
+            source = form.source_var.get().strip()
+            webhook_name = form.webhook_var.get()
+            
+            # Validate inputs
+            if source_option == "manual" and not source:
+                form.status_var.set("Please enter a source")
+                return
+            
+            if not webhook_name:
+                form.status_var.set("Please select a webhook")
+                return
+            
+            # Create base task dict
+            now_dt = datetime.now()
+            now_iso = now_dt.isoformat()
+            task_id = task.get("id") or f"task_{int(now_dt.timestamp())}_{next(self._id_counter)}"
+            new_task = {
+                "id": task_id,
+                "platform": form.platform_var.get(),
+                "webhook": webhook_name,
+                "updated": now_iso
+            }
+            
+            # Add created timestamp if it's a new task
+            if not is_edit:
+                new_task["created"] = now_iso
+            elif "created" in task:
+                new_task["created"] = task["created"]
+            
+            # Add manual source or selected videos
+            if source_option == "manual":
+                new_task["source"] = source
+            else:
+                # Get the checked videos, storing only the essential info for each
+                new_task["selected_videos"] = [
+                    _saved_video(form.videos[i]) for i in sorted(form.selected_videos)
+                ]
+            
+            # Add scheduling info if enabled
+            if form.enabled_var.get():
+                try:
+                    # Parse date and time
+                    date_str = form.date_var.get()
+                    hour_str = form.hour_var.get().zfill(2)
+                    minute_str = form.minute_var.get().zfill(2)
+                    
+                    # Validate date format
+                    start_time = datetime.fromisoformat(f"{date_str}T{hour_str}:{minute_str}:00")
+                    
+                    # Add to task
+                    interval_value = int(form.interval_value_var.get())
+                    interval_type = form.interval_type_var.get()
+                    new_task["start_time"] = start_time.isoformat()
+                    new_task["interval_value"] = interval_value
+                    new_task["interval_type"] = interval_type
+                    new_task["enabled"] = True
+                    
+                    # Create a human-readable schedule string
+                    if interval_value == 1:
+                        schedule_str = f"Every {interval_type[:-1]}"  # Remove 's' for singular
+                    else:
+                        schedule_str = f"Every {interval_value} {interval_type}"
+                    
+                    new_task["schedule"] = schedule_str
                 
-                if not webhook_var.get():
-                    status_var.set("Please select a webhook")
+                except ValueError as e:
+                    form.status_var.set(f"Invalid date or time: {e}")
                     return
+            else:
+                new_task["enabled"] = False
+                new_task["schedule"] = "Manual"
+            
+            # Add max items
+            try:
+                new_task["max_items"] = int(form.max_items_var.get())
+            except ValueError:
+                new_task["max_items"] = 1
+            
+            _task_changed(new_task)
+            
+            # Save to config
+            if hasattr(self, "config_manager"):
+                config_manager = self.config_manager
+                config = config_manager.config
                 
-                # Create base task dict
-                new_task = {
-                    "id": task.get("id", f"task_{int(datetime.now().timestamp())}"),
-                    "platform": platform_var.get(),
-                    "webhook": webhook_var.get(),
-                    "updated": datetime.now().isoformat()
-                }
-                
-                # Add created timestamp if it's a new task
-                if not is_edit:
-                    new_task["created"] = datetime.now().isoformat()
-                elif "created" in task:
-                    new_task["created"] = task["created"]
-                
-                # Add manual source or selected videos
-                if source_option_var.get() == "manual":
-                    new_task["source"] = source_var.get().strip()
-                else:
-                    # Get selected videos from video_vars
-                    selected_videos = []
-                    for i, var in enumerate(video_vars):
-                        if var.get() and i < len(video_frames):
-                            selected_videos.append(video_frames[i].video)
-                    
-                    # Only store essential info for each video
-                    new_task["selected_videos"] = [
-                        {
-                            "id": video.get("id", ""),
-                            "title": video.get("title", ""),
-                            "url": video.get("url", ""),
-                            "thumbnail": video.get("thumbnail", ""),
-                            "published": video.get("published", "")
-                        }
-                        for video in selected_videos
-                    ]
-                
-                # Add scheduling info if enabled
-                if enabled_var.get():
-                    try:
-                        # Parse date and time
-                        date_str = date_var.get()
-                        hour_str = hour_var.get().zfill(2)
-                        minute_str = minute_var.get().zfill(2)
-                        
-                        # Validate date format
-                        start_time = datetime.fromisoformat(f"{date_str}T{hour_str}:{minute_str}:00")
-                        
-                        # Add to task
-                        new_task["start_time"] = start_time.isoformat()
-                        new_task["interval_value"] = int(interval_value_var.get())
-                        new_task["interval_type"] = interval_type_var.get()
-                        new_task["enabled"] = True
-                        
-                        # Create a human-readable schedule string
-                        interval_value = int(interval_value_var.get())
-                        interval_type = interval_type_var.get()
-                        if interval_value == 1:
-                            schedule_str = f"Every {interval_type[:-1]}"  # Remove 's' for singular
-                        else:
-                            schedule_str = f"Every {interval_value} {interval_type}"
-                        
-                        new_task["schedule"] = schedule_str
-                        
-                    except ValueError as e:
-                        status_var.set(f"Invalid date or time: {e}")
-                        return
-                else:
-                    new_task["enabled"] = False
-                    new_task["schedule"] = "Manual"
+                # Get current tasks
+                tasks = config.get("scheduled_tasks", [])
                 
-                # Add max items
+                # Replace the old task if editing, otherwise add the new task
+                old_task = self._tasks_by_id.get(new_task["id"]) if is_edit else None
                 try:
-                    new_task["max_items"] = int(max_items_var.get())
+                    tasks[tasks.index(old_task)] = new_task
                 except ValueError:
-                    new_task["max_items"] = 1
-                
-                # Save to config
-                if hasattr(self, "config_manager"):
-                    # Get current tasks
-                    tasks = self.config_manager.config.get("scheduled_tasks", [])
-                    
-                    # Remove old task if editing
-                    if is_edit:
-                        tasks = [t for t in tasks if t.get("id") != new_task["id"]]
-                    
-                    # Add the new task
                     tasks.append(new_task)
-                    
-                    # Update config
-                    self.config_manager.config["scheduled_tasks"] = tasks
-                    self.config_manager.save_config()
-                    
-                    # Update UI
-                    self._refresh_tasks()
-                    
-                    # Close window
-                    add_window.destroy()
-                else:
-                    status_var.set("Error: Config manager not available")
-            
-            except Exception as e:
-                logger.error(f"Error saving task: {e}", exc_info=True)
-                status_var.set(f"Error: {str(e)}")
+                
+                # Update config
+                config["scheduled_tasks"] = tasks
+                config_manager.save_config()
+                
+                # Update UI
+                self._refresh_tasks()
+                
+                # Close window
+                add_window.destroy()
+            else:
+                form.status_var.set("Error: Config manager not available")
         
-        # Add buttons
-        ttk.Button(button_frame, text="Cancel", command=add_window.destroy).pack(side="right", padx=5)
-        ttk.Button(button_frame, text="Save", command=save_task).pack(side="right", padx=5)
+        except Exception as e:
+            logger.error(f"Error saving task: {e}", exc_info=True)
+            form.status_var.set(f"Error: {str(e)}")
     
     def _add_task_dialog(self):
         """Show the add task dialog."""
@@ -524,8 +909,8 @@ class TasksTab(BaseUI):
             return
         
         # Get the selected task
-        task_id = self.tasks_tree.item(selected[0], "tags")[0]
-        task = next((t for t in self.tasks if t.get("id") == task_id), None)
+        task_id = str(self.tasks_tree.item(selected[0], "tags")[0])
+        task = self._tasks_by_id.get(task_id)
         if not task:
             messagebox.showerror("Error", "Task not found")
             return
@@ -544,15 +929,17 @@ class TasksTab(BaseUI):
             return
         
         # Get the selected task
-        task_id = self.tasks_tree.item(selected[0], "tags")[0]
+        task_id = str(self.tasks_tree.item(selected[0], "tags")[0])
         
         # Confirm deletion
         if messagebox.askyesno("Confirm", "Are you sure you want to remove this task?"):
-            # Remove the task from the list
-            self.tasks = [t for t in self.tasks if t.get("id") != task_id]
+            # Remove the task from the list in place
+            task = self._tasks_by_id.pop(task_id, None)
+            if task is not None:
+                self._tasks.remove(task)
             
             # Save to config
-            self.save_tasks()
+            self._schedule_save()
             
             # Refresh the display
             self._load_tasks()
@@ -565,16 +952,16 @@ class TasksTab(BaseUI):
             return
         
         # Get the selected task
-        task_id = self.tasks_tree.item(selected[0], "tags")[0]
+        task_id = str(self.tasks_tree.item(selected[0], "tags")[0])
         
         # Find the task and toggle its state
-        for task in self.tasks:
-            if task.get("id") == task_id:
-                task["enabled"] = not task.get("enabled", True)
-                break
+        task = self._tasks_by_id.get(task_id)
+        if task:
+            task["enabled"] = not task.get("enabled", True)
+            _task_changed(task)
         
         # Save to config
-        self.save_tasks()
+        self._schedule_save()
         
         # Refresh the display
         self._load_tasks()
@@ -587,11 +974,11 @@ class TasksTab(BaseUI):
             return
         
         # Get the task ID from the selected item
-        task_id = self.tasks_tree.item(selection[0])['values'][0]
+        task_id = str(self.tasks_tree.item(selection[0], "tags")[0])
         logger.info(f"Running task with ID: {task_id}")
         
         # Find the task in the list
-        task = next((t for t in self._tasks if str(t.get('id')) == str(task_id)), None)
+        task = self._tasks_by_id.get(task_id)
         if not task:
             messagebox.showerror("Task Error", f"Task with ID {task_id} not found.")
             return
@@ -599,12 +986,44 @@ class TasksTab(BaseUI):
         # Update the status
         self.status_var.set(f"Running task: {task.get('source')}")
         
-        # Run the task in a separate thread
-        threading.Thread(target=self._execute_task, args=(task,), daemon=True).start()
+        # Run the task on a worker thread
+        self.submit_task(task)
+    
+    def submit_task(self, task):
+        """
+        Run a task on a worker thread, so fetching and sending don't block the UI.
+        
+        Args:
+            task: Task to execute
+            
+        Returns:
+            Future of the task run
+        """
+        return _TASK_EXECUTOR.submit(self._execute_task, task)
+    
+    def _set_status(self, message):
+        """
+        Set the status bar text from a worker thread.
+        
+        Args:
+            message: Status text
+        """
+        self.frame.after(0, self.status_var.set, message)
+    
+    def _show_message(self, show, title, message):
+        """
+        Show a message box from a worker thread.
+        
+        Args:
+            show: messagebox function, such as messagebox.showerror
+            title: Message box title
+            message: Message text
+        """
+        self.frame.after(0, show, title, message)
     
     def _execute_task(self, task):
         """
-        Execute a scheduled task.
+        Execute a scheduled task on a worker thread.
         
         Args:
             task: Task to execute
@@ -615,86 +1034,59 @@ class TasksTab(BaseUI):
         max_items = task.get("max_items", 5)
         
         # Check if we have selected videos saved
-        has_selected_videos = "selected_videos" in task and task["selected_videos"]
-        selected_video_ids = [video.get("id") for video in task.get("selected_videos", [])]
+        selected_videos = task.get("selected_videos") or []
+        has_selected_videos = bool(selected_videos)
         
         logger.info(f"Executing task: ID={task.get('id')}, Platform={platform}, Webhook={webhook_name}")
-        logger.info(f"Has selected videos: {has_selected_videos}, Count: {len(selected_video_ids) if selected_video_ids else 0}")
+        logger.info(f"Has selected videos: {has_selected_videos}, Count: {len(selected_videos)}")
         
         try:
             # Get connectors
             source_connector = None
             discord_connector = None
             
-            try:
-                # Try to import connectors using factory
-                from src.api_connectors.factory import get_connector
-                
-                # Get API credentials for the platform
-                platform_credentials = {}
-                if hasattr(self, 'config_manager'):
-                    platform_credentials = self.config_manager.credentials.get(platform, {})
-                else:
-                    logger.warning("No config_manager available, using empty credentials")
-                
-                # Create the connectors with the appropriate credentials
-                source_connector = get_connector(platform, platform_credentials)
+            if get_connector is None:
+                error_msg = f"Error importing connectors: {_CONNECTOR_IMPORT_ERROR}"
+                logger.error(error_msg)
+                self._set_status(f"Error: {error_msg}")
+                self._show_message(messagebox.showerror, "Import Error", error_msg)
+                return
+            
+            # Create the connectors with the appropriate credentials; only YouTube
+            # sources are fetched from the API
+            credentials = self.config_manager.credentials
+            if platform == "youtube":
+                source_connector = get_connector(platform, credentials.get(platform, {}))
                 logger.info(f"Created {platform} connector with credentials")
-                
-                discord_credentials = {}
-                if hasattr(self, 'config_manager'):
-                    discord_credentials = self.config_manager.credentials.get("discord", {})
-                
-                discord_connector = get_connector("discord", discord_credentials)
-                logger.info(f"Created Discord connector with credentials")
-            except ImportError as e:
-                logger.error(f"Error importing connector factory: {e}", exc_info=True)
-                # Try direct imports if the factory isn't available
-                try:
-                    if platform == "youtube":
-                        from src.api_connectors.youtube import YouTubeConnector
-                        platform_credentials = {}
-                        if hasattr(self, 'config_manager'):
-                            platform_credentials = self.config_manager.credentials.get(platform, {})
-                        source_connector = YouTubeConnector(platform_credentials)
-                    
-                    from src.api_connectors.discord import DiscordConnector
-                    discord_credentials = {}
-                    if hasattr(self, 'config_manager'):
-                        discord_credentials = self.config_manager.credentials.get("discord", {})
-                    discord_connector = DiscordConnector(discord_credentials)
-                except ImportError as e2:
-                    error_msg = f"Error importing connectors: {e2}"
-                    logger.error(error_msg)
-                    self.status_var.set(f"Error: {error_msg}")
-                    messagebox.showerror("Import Error", error_msg)
-                    return
+            
+            discord_connector = get_connector("discord", credentials.get("discord", {}))
+            logger.info(f"Created Discord connector with credentials")
             
             # Get the webhook URL
-            webhook = None
-            if hasattr(self, 'config_manager'):
-                webhooks = self.config_manager.config.get("webhooks", [])
-                for wh in webhooks:
-                    if wh.get("name") == webhook_name:
-                        webhook = wh
-                        break
+            webhooks_by_name = self._webhooks_by_name
+            if webhooks_by_name is None:
+                webhooks_by_name = {}
+                for wh in self.config_manager.config.get("webhooks", []):
+                    webhooks_by_name.setdefault(wh.get("name"), wh)
+                self._webhooks_by_name = webhooks_by_name
+            webhook = webhooks_by_name.get(webhook_name)
             
             if not webhook:
                 error_msg = f"Webhook '{webhook_name}' not found"
                 logger.error(error_msg)
-                self.status_var.set(f"Error: {error_msg}")
-                messagebox.showerror("Webhook Error", error_msg)
+                self._set_status(f"Error: {error_msg}")
+                self._show_message(messagebox.showerror, "Webhook Error", error_msg)
                 return
             
             # Fetch content
-            self.status_var.set(f"Fetching content from {platform}...")
+            self._set_status(f"Fetching content from {platform}...")
             
             # Always prioritize using the selected videos if they exist
             items = []
             
             if has_selected_videos:
                 logger.info("Using task's selected videos")
-                items = task["selected_videos"]
+                items = selected_videos
                 
                 # Make sure each item has the necessary fields for posting
                 for item in items:
@@ -717,59 +1109,104 @@ class TasksTab(BaseUI):
                     # Check if source is a channel ID or a search term
                     if source and source.startswith("UC"):  # YouTube channel IDs start with UC
                         logger.info(f"Fetching from YouTube channel: {source}")
-                        items = source_connector.fetch(channel_id=source, max_results=max_items)
+                        items = self._cached_fetch(source_connector, platform, max_items, channel_id=source)
                     elif source:
                         logger.info(f"Searching YouTube for: {source}")
-                        items = source_connector.fetch(query=source, max_results=max_items)
+                        items = self._cached_fetch(source_connector, platform, max_items, query=source)
                     else:
                         logger.warning("No source specified for YouTube")
             
             logger.info(f"Final list contains {len(items) if items else 0} items to post")
             
+            # Leave out items already posted to this webhook, by this or another task
+            posted = get_config_cache(self.config_manager, "posted")
+            webhook_key = _webhook_key(webhook["url"])
+            if items:
+                new_items = _new_items(items, posted, webhook_key)
+                if not new_items:
+                    no_new_items_msg = f"No new items from {platform}; all were already posted"
+                    self._set_status(no_new_items_msg)
+                    logger.info(no_new_items_msg)
+                    self.frame.after(0, self._update_task_next_run, task)
+                    return
+                logger.info(f"Skipping {len(items) - len(new_items)} items already posted")
+                items = new_items
+            
             # Send to Discord
             if items:
-                self.status_var.set(f"Sending {len(items)} items to Discord...")
+                self._set_status(f"Sending {len(items)} items to Discord...")
                 
-                for item in items:
-                    # Create an embed for the item
-                    embed = {
-                        "title": item.get("title", ""),
-                        "description": item.get("description", "")[:200] + "..." if item.get("description", "") else "",
-                        "url": item.get("url", ""),
-                        "color": 0x00ff00,  # Green
-                        "thumbnail": {"url": item.get("thumbnail", "")},
-                        "fields": [
-                            {"name": "Source", "value": platform.capitalize(), "inline": True},
-                            {"name": "Published", "value": item.get("published", ""), "inline": True}
-                        ]
-                    }
+                # Create an embed for each item
+                source_name = platform.capitalize()
+                embeds = [_item_embed(item, source_name) for item in items]
+                
+                # Send the embeds in as few messages as Discord allows, in order
+                for start in range(0, len(embeds), _MAX_EMBEDS_PER_MESSAGE):
+                    batch = embeds[start:start + _MAX_EMBEDS_PER_MESSAGE]
                     
                     # Log the message being sent
-                    logger.info(f"Sending embed: {embed['title']}")
+                    logger.info(f"Sending embeds: {', '.join(embed['title'] for embed in batch)}")
                     
                     # Send the message
-                    discord_connector.send_webhook_message(
+                    result = discord_connector.send_webhook_message(
                         webhook["url"],
-                        content=f"New content from {platform.capitalize()}",
-                        embeds=[embed]
+                        content=f"New content from {source_name}",
+                        embeds=batch
                     )
+                    
+                    # Remember the posted items
+                    if result.get("success"):
+                        posted.set_many(
+                            [((webhook_key, item["id"]), True)
+                             for item in items[start:start + _MAX_EMBEDS_PER_MESSAGE]
+                             if item.get("id") is not None],
+                            _POSTED_TTL
+                        )
                 
-                self.status_var.set(f"Task completed: Sent {len(items)} items to Discord")
+                self._set_status(f"Task completed: Sent {len(items)} items to Discord")
                 logger.info(f"Task completed successfully")
                 
                 # Update next run time
-                self._update_task_next_run(task)
+                self.frame.after(0, self._update_task_next_run, task)
             else:
                 no_items_msg = f"No items found from {platform}"
-                self.status_var.set(no_items_msg)
+                self._set_status(no_items_msg)
                 logger.warning(no_items_msg)
-                messagebox.showinfo("No Content", no_items_msg)
+                self._show_message(messagebox.showinfo, "No Content", no_items_msg)
             
         except Exception as e:
             error_msg = f"Error executing task: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            self.status_var.set(error_msg)
-            messagebox.showerror("Task Error", error_msg)
+            self._set_status(error_msg)
+            self._show_message(messagebox.showerror, "Task Error", error_msg)
+    
+    def _cached_fetch(self, connector, platform, max_items, **params):
+        """
+        Fetch items from a platform, reusing recent results for the same source.
+        
+        Repeated runs against the same channel or search within _FETCH_TTL
+        seconds use the cached items instead of spending API quota.
+        
+        Args:
+            connector: Platform connector
+            platform: Platform name
+            max_items: Maximum number of items to fetch
+            **params: Source parameters passed to the connector's fetch
+            
+        Returns:
+            list: Fetched items
+        """
+        cache = get_config_cache(self.config_manager, platform)
+        key = [platform, max_items, sorted(params.items())]
+        items = cache.get(key)
+        if items is not None:
+            logger.info(f"Using cached {platform} results for {params}")
+            return items
+        
+        items = connector.fetch(max_results=max_items, **params)
+        if items:
+            cache.set(key, items, _FETCH_TTL)
+        return items
     
     def _update_task_next_run(self, task):
         """
@@ -804,74 +1241,56 @@ class TasksTab(BaseUI):
         
         # Update the task
         task["next_run"] = next_run.isoformat()
+        _task_changed(task)
         
         # Save the changes
-        self.save_tasks()
+        self._schedule_save()
         
         # Refresh the display
-        self._load_tasks()
+        self._schedule_refresh()
+    
+    def _schedule_save(self):
+        """Save tasks after a short delay, once for any changes made meanwhile."""
+        if self._pending_save is None:
+            self._pending_save = self.frame.after(_SAVE_DELAY_MS, self.save_tasks)
     
-    def save_tasks(self):
-        """Save tasks to configuration."""
+    def save_pending_tasks(self, fsync=False):
+        """
+        Save tasks now if a delayed save is pending.
+        
+        Args:
+            fsync: Whether to wait for the file to reach the disk
+        """
+        if self._pending_save is not None:
+            self.save_tasks(fsync=fsync)
+    
+    def save_tasks(self, fsync=False):
+        """
+        Save tasks to configuration.
+        
+        The config is encoded here, reusing the cached JSON of unchanged tasks, and
+        written by the config manager's background writer. Observers aren't notified
+        because no other tab depends on task state.
+        
+        Args:
+            fsync: Whether to write the file on this thread and wait for it to reach
+                the disk. Task state is saved often and losing the last change in a
+                system crash is acceptable, so this is only done when the
+                application closes.
+        """
+        if self._pending_save is not None:
+            self.frame.after_cancel(self._pending_save)
+            self._pending_save = None
         try:
-            logger.info(f"save_tasks called with {len(self._tasks)} tasks")
-            for i, task in enumerate(self._tasks):
-                logger.info(f"Task {i}: ID={task.get('id')}, Platform={task.get('platform')}")
-            
-            # Try direct file approach first
-            config_file = os.path.join(self.config_manager.config_dir, "config.json")
-            logger.info(f"Direct save to config file: {config_file}")
-            logger.info(f"Config manager dir: {self.config_manager.config_dir}")
+            # Lazy %-style arguments skip formatting when DEBUG logging is off
+            logger.debug("save_tasks called with %d tasks", len(self._tasks))
             
-            # Check if config file exists
-            if not os.path.exists(config_file):
-                logger.error(f"Config file not found: {config_file}")
-                logger.info("Falling back to config_manager.update_config")
+            config = self.config_manager.config
+            config["scheduled_tasks"] = self._tasks
+            if fsync:
+                self.config_manager.write_config(_config_json, fsync=True)
             else:
-                # Read current config
-                try:
-                    with open(config_file, 'r') as f:
-                        config = json.load(f)
-                    logger.info(f"Successfully read config with {len(config.keys())} keys")
-                    
-                    # Update scheduled_tasks
-                    config['scheduled_tasks'] = self._tasks
-                    logger.info(f"Updated config scheduled_tasks with {len(self._tasks)} tasks")
-                    
-                    # Write back to file
-                    with open(config_file, 'w') as f:
-                        json.dump(config, f, indent=4)
-                    logger.info(f"Successfully wrote updated config back to file")
-                    
-                    # Update config manager's cache
-                    if hasattr(self, 'config_manager'):
-                        self.config_manager.config = config
-                    logger.info("Updated config manager's in-memory config")
-                    
-                    # Notify observers manually
-                    if hasattr(self, 'config_manager'):
-                        self.config_manager._notify_observers()
-                    logger.info("Manually notified observers")
-                    
-                    return
-                except Exception as e:
-                    logger.error(f"Error with direct file approach: {e}", exc_info=True)
-                    logger.info("Falling back to config_manager.update_config")
-            
-            # Fallback to original approach
-            before_tasks = []
-            if hasattr(self, 'config_manager'):
-                before_tasks = self.config_manager.config.get("scheduled_tasks", [])
-            logger.info(f"Before update: Config has {len(before_tasks)} tasks")
-            
-            if hasattr(self, 'config_manager'):
-                self.config_manager.update_config("scheduled_tasks", self._tasks)
-            
-            after_tasks = []
-            if hasattr(self, 'config_manager'):
-                after_tasks = self.config_manager.config.get("scheduled_tasks", [])
-            logger.info(f"After update: Config has {len(after_tasks)} tasks")
-            logger.info("Tasks saved successfully")
+                self.config_manager.save_config_text(_config_json(config))
         except Exception as e:
             logger.error(f"Error in save_tasks: {e}", exc_info=True)
             raise
@@ -880,12 +1299,15 @@ class TasksTab(BaseUI):
         """Called when configuration changes."""
         try:
             logger.info("on_config_changed called")
+            self._webhook_names = None
+            self._webhooks_by_name = None
             old_tasks_count = len(self._tasks)
             
             # Get updated tasks from config
-            self._tasks = []
+            tasks = []
             if hasattr(self, 'config_manager'):
-                self._tasks = self.config_manager.config.get("scheduled_tasks", [])
+                tasks = self.config_manager.config.get("scheduled_tasks", [])
+            self.tasks = tasks
             new_tasks_count = len(self._tasks)
             
             logger.info(f"Tasks updated: {old_tasks_count} -> {new_tasks_count}")
@@ -898,22 +1320,23 @@ class TasksTab(BaseUI):
     
     def _populate_content_listbox(self, listbox, platform):
         """Populate the content listbox with fetched content."""
-        # Clear existing content
-        listbox.delete(0, tk.END)
-        
-        # Get fetched content from the fetching tab
+        # Get the display text of the fetched content from the fetching tab
+        display_texts = ()
         if self.fetching_tab:
             content = self.fetching_tab.get_fetched_content(platform)
             if content:
-                for item in content:
-                    # Get the display text to show in listbox
-                    display_text = item.get("display_text", "Unknown content")
-                    
-                    # Save the item's source ID as well
-                    source_id = item.get("source_id", "")
-                    
-                    # Add to listbox
-                    listbox.insert(tk.END, display_text)
+                display_texts = tuple(item.get("display_text", "Unknown content") for item in content)
+        
+        # Leave the listbox alone if it already shows this content
+        shown = (platform, display_texts)
+        if getattr(listbox, "shown_content", None) == shown:
+            return
+        listbox.shown_content = shown
+        
+        # Replace the content, adding all lines in one call
+        listbox.delete(0, tk.END)
+        if display_texts:
+            listbox.insert(tk.END, *display_texts)
     
     def _toggle_content_source(self, use_fetched, listbox, entry):
         """Toggle between using fetched content and manual entry."""
@@ -924,7 +1347,112 @@ class TasksTab(BaseUI):
             listbox.config(state="disabled")
             entry.config(state="normal")
 
-    def _populate_fetched_videos(self, platform, videos_frame, status_var, video_vars, video_frames, task=None):
+    def _create_video_list(self, parent, rows, selected):
+        """
+        Create a list of videos with a check mark on each row.
+        
+        A single tree holds all rows, so long lists don't need a widget per video.
+        Clicking a row's check mark toggles it.
+        
+        Args:
+            parent: Parent widget
+            rows: (title, published) tuple for each video
+            selected: Set of checked row indices, updated as rows are toggled
+            
+        Returns:
+            ttk.Treeview: The video list
+        """
+        columns = [("title", "Title", 400), ("published", "Published", 120)]
+        tree_frame, tree = self.create_treeview(parent, columns, show="tree headings")
+        tree.column("#0", width=40, minwidth=40, stretch=False)
+        
+        # Row IDs are the video indices. Rows are added before the list is shown,
+        # so it is laid out once.
+        for i, (title, published) in enumerate(rows):
+            mark = _CHECKED_MARK if i in selected else _UNCHECKED_MARK
+            tree.insert("", "end", iid=str(i), text=mark, values=(title, published))
+        tree_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        def toggle(event):
+            row = tree.identify_row(event.y)
+            if not row or tree.identify_column(event.x) != "#0":
+                return
+            index = int(row)
+            if index in selected:
+                selected.discard(index)
+                tree.item(row, text=_UNCHECKED_MARK)
+            else:
+                selected.add(index)
+                tree.item(row, text=_CHECKED_MARK)
+        
+        # Show the full text of long titles while the pointer is over their row
+        hovered = [None]
+        
+        def motion(event):
+            row = tree.identify_row(event.y)
+            if row == hovered[0]:
+                return
+            hovered[0] = row
+            title = rows[int(row)][0] if row else ""
+            if len(title) > _TOOLTIP_TITLE_LENGTH:
+                self._show_tooltip(title, event.x_root + 25, event.y_root + 20)
+            else:
+                self._hide_tooltip()
+        
+        def leave(event):
+            hovered[0] = None
+            self._hide_tooltip()
+        
+        tree.bind("<Button-1>", toggle, add="+")
+        tree.bind("<Motion>", motion, add="+")
+        tree.bind("<Leave>", leave, add="+")
+        tree.bind("<Destroy>", leave, add="+")
+        return tree
+    
+    def _show_tooltip(self, text, x, y):
+        """
+        Show the shared tooltip window.
+        
+        Args:
+            text: Tooltip text
+            x: Screen x coordinate
+            y: Screen y coordinate
+        """
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self.frame)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip_label = tk.Label(self._tooltip, wraplength=400,
+                                           background="#ffffe0", relief="solid", borderwidth=1)
+            self._tooltip_label.pack(padx=2, pady=2)
+        self._tooltip_label.config(text=text)
+        self._tooltip.wm_geometry(f"+{x}+{y}")
+        self._tooltip.deiconify()
+        self._tooltip.lift()
+    
+    def _hide_tooltip(self):
+        """Hide the shared tooltip window."""
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
+    
+    def _set_all_videos(self, tree, selected, checked):
+        """
+        Check or uncheck every row of a video list.
+        
+        Args:
+            tree: Video list created by _create_video_list
+            selected: Set of checked row indices
+            checked: Whether the rows are checked
+        """
+        rows = tree.get_children()
+        if checked:
+            selected.update(range(len(rows)))
+        else:
+            selected.clear()
+        mark = _CHECKED_MARK if checked else _UNCHECKED_MARK
+        for row in rows:
+            tree.item(row, text=mark)
+    
+    def _populate_fetched_videos(self, platform, videos_frame, status_var, videos, selected, task=None):
         """
         Populate the videos frame with fetched videos from the specified platform.
         
@@ -932,8 +1460,8 @@ class TasksTab(BaseUI):
             platform: Platform to get videos from
             videos_frame: Frame to populate with videos
             status_var: StringVar for status updates
-            video_vars: List to store video checkbox variables
-            video_frames: List to store video frames
+            videos: List to store the listed videos
+            selected: Set to store the indices of the checked videos
             task: Task data if this is an edit operation
         """
         # Clear any existing videos
@@ -941,8 +1469,8 @@ class TasksTab(BaseUI):
             widget.destroy()
         
         # Clear our tracking lists
-        video_vars.clear()
-        video_frames.clear()
+        videos.clear()
+        selected.clear()
         
         # Update status
         status_var.set(f"Fetching videos from {platform}...")
@@ -955,93 +1483,40 @@ class TasksTab(BaseUI):
                 return
             
             # Get videos from the platform
-            videos = fetching_tab.get_fetched_content(platform)
+            fetched = fetching_tab.get_fetched_content(platform)
             
-            if not videos:
+            if not fetched:
                 status_var.set(f"No videos found for {platform}. Please fetch videos first.")
                 return
-            
-            # Create a canvas for scrolling
-            canvas = tk.Canvas(videos_frame)
-            scrollbar = ttk.Scrollbar(videos_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = ttk.Frame(canvas)
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            videos.extend(fetched)
             
             # Track videos that are already selected from the task
-            selected_video_ids = []
-            if task and "selected_videos" in task:
-                selected_video_ids = [v.get("id") for v in task.get("selected_videos", [])]
+            selected_video_ids = {v.get("id") for v in task.get("selected_videos", ())} if task else set()
             
-            # Create video selection checkboxes
+            rows = []
             for i, video in enumerate(videos):
-                # Create a frame for this video
-                video_frame = ttk.Frame(scrollable_frame)
-                video_frame.pack(fill="x", padx=5, pady=5, anchor="w")
-                
                 # Determine if this video should be pre-selected
-                is_selected = video.get("id") in selected_video_ids
-                var = tk.BooleanVar(value=is_selected)
-                video_vars.append(var)
-                
-                # Add checkbox with video title
-                title = video.get("title", "Untitled Video")
-                checkbox = ttk.Checkbutton(
-                    video_frame, 
-                    text=title, 
-                    variable=var,
-                    width=60
-                )
-                checkbox.pack(side="left", fill="x", expand=True, anchor="w")
-                
-                # Add video details
-                if "published" in video:
-                    published = video.get("published", "")
-                    if isinstance(published, str):
-                        # Try to parse the date if it's a string
-                        try:
-                            dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                            published = dt.strftime("%Y-%m-%d")
-                        except (ValueError, AttributeError):
-                            # Keep as is if parsing fails
-                            pass
-                    
-                    # Add published date
-                    ttk.Label(
-                        video_frame, 
-                        text=f"Published: {published}"
-                    ).pack(side="right", padx=5)
+                if video.get("id") in selected_video_ids:
+                    selected.add(i)
                 
-                # Store the video for retrieval
-                video_frame.video = video
-                video_frames.append(video_frame)
+                published = video.get("published", "")
+                if isinstance(published, str):
+                    published = _published_date(published)
+                rows.append((video.get("title", "Untitled Video"), published))
+            
+            tree = self._create_video_list(videos_frame, rows, selected)
             
             # Store the items on the frame for reference
             videos_frame.items = videos
             
             # Add "Select All" and "Deselect All" buttons
-            buttons_frame = ttk.Frame(scrollable_frame)
+            buttons_frame = ttk.Frame(videos_frame)
             buttons_frame.pack(fill="x", padx=5, pady=5, anchor="w")
             
-            def select_all():
-                for var in video_vars:
-                    var.set(True)
-            
-            def deselect_all():
-                for var in video_vars:
-                    var.set(False)
-            
-            ttk.Button(buttons_frame, text="Select All", command=select_all).pack(side="left", padx=5)
-            ttk.Button(buttons_frame, text="Deselect All", command=deselect_all).pack(side="left", padx=5)
+            ttk.Button(buttons_frame, text="Select All",
+                       command=lambda: self._set_all_videos(tree, selected, True)).pack(side="left", padx=5)
+            ttk.Button(buttons_frame, text="Deselect All",
+                       command=lambda: self._set_all_videos(tree, selected, False)).pack(side="left", padx=5)
             
             # Update status
             status_var.set(f"Found {len(videos)} videos from {platform}")
@@ -1050,7 +1525,7 @@ class TasksTab(BaseUI):
             logger.error(f"Error populating videos: {e}", exc_info=True)
             status_var.set(f"Error: {str(e)}")
     
-    def _populate_task_selected_videos(self, task, videos_frame, status_var, video_vars, video_frames):
+    def _populate_task_selected_videos(self, task, videos_frame, status_var, videos, selected):
         """
         Populate the videos frame with a task's selected videos.
         
@@ -1058,14 +1533,11 @@ class TasksTab(BaseUI):
             task: Task with selected videos
             videos_frame: Frame to populate
             status_var: Status variable to update
-            video_vars: List to store video checkbox variables
-            video_frames: List to store video frames
+            videos: List to store the listed videos
+            selected: Set to store the indices of the checked videos
         """
-        # Clear existing video frames
-        for frame in video_frames:
-            frame.destroy()
-        video_frames.clear()
-        video_vars.clear()
+        videos.clear()
+        selected.clear()
         
         # Remove all existing widgets
         for widget in videos_frame.winfo_children():
@@ -1079,7 +1551,7 @@ class TasksTab(BaseUI):
             justify="center"
         )
         loading_label.pack(expand=True, fill="both", padx=20, pady=40)
-        videos_frame.update()
+        videos_frame.update_idletasks()
         
         try:
             # Get the task's selected videos
@@ -1107,52 +1579,23 @@ class TasksTab(BaseUI):
             header_frame = ttk.Frame(videos_frame)
             header_frame.pack(fill="x", padx=5, pady=10, anchor="w")
             
+            # All videos start selected
+            videos.extend(selected_videos)
+            selected.update(range(len(videos)))
             select_all_var = tk.BooleanVar(value=True)
             
-            def toggle_all():
-                new_state = select_all_var.get()
-                for var in video_vars:
-                    var.set(new_state)
-            
             select_all_cb = ttk.Checkbutton(
                 header_frame, 
                 text="Select/Deselect All", 
                 variable=select_all_var,
-                command=toggle_all
+                command=lambda: self._set_all_videos(tree, selected, select_all_var.get())
             )
             select_all_cb.pack(side="left", padx=(5, 20))
             
             ttk.Label(header_frame, text=f"Total videos: {len(selected_videos)}").pack(side="left")
             
-            # Create a scrollable frame for videos
-            canvas_frame = ttk.Frame(videos_frame)
-            canvas_frame.pack(fill="both", expand=True, padx=5, pady=5)
-            
-            canvas = tk.Canvas(canvas_frame)
-            scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = ttk.Frame(canvas)
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-            
-            # Create a checkbox for each video
+            rows = []
             for i, item in enumerate(selected_videos):
-                var = tk.BooleanVar(value=True)  # Default to selected
-                video_vars.append(var)
-                
-                # Create a frame for this video
-                frame = ttk.Frame(scrollable_frame)
-                frame.pack(fill="x", padx=5, pady=5, anchor="w")
-                video_frames.append(frame)
-                
                 # Get title from the video item
                 if isinstance(item, dict):
                     if "title" in item:
@@ -1161,109 +1604,22 @@ class TasksTab(BaseUI):
                         title = item["snippet"]["title"]
                     else:
                         title = f"Video {i+1}"
+                    published = item.get("published", "")
+                    if isinstance(published, str):
+                        published = _published_date(published)
                 else:
                     title = f"Video {i+1}"
-                
-                # Add checkbox
-                cb = ttk.Checkbutton(
-                    frame, 
-                    text=title,
-                    variable=var
-                )
-                cb.pack(side="left", anchor="w")
-                
-                # Add tooltip for full title
-                if len(title) > 50:
-                    # Simple tooltip using a label that appears on hover
-                    tooltip = None
-                    tooltip_text = title
-                    
-                    def enter(event, tooltip_text=tooltip_text):
-                        nonlocal tooltip
-                        x = event.widget.winfo_rootx() + 25
-                        y = event.widget.winfo_rooty() + 20
-                        
-                        # Create a toplevel window
-                        tooltip = tk.Toplevel(event.widget)
-                        tooltip.wm_overrideredirect(True)
-                        tooltip.wm_geometry(f"+{x}+{y}")
-                        
-                        label = tk.Label(tooltip, text=tooltip_text, wraplength=400,
-                                      background="#ffffe0", relief="solid", borderwidth=1)
-                        label.pack(padx=2, pady=2)
-                    
-                    def leave(event):
-                        nonlocal tooltip
-                        if tooltip:
-                            tooltip.destroy()
-                            tooltip = None
-                    
-                    cb.bind("<Enter>", enter)
-                    cb.bind("<Leave>", leave)
-                    
-                    # Also enable tooltip for the video details line
-                    def create_tooltip(widget, tooltip_text):
-                        tooltip = None
-                        
-                        def enter(event):
-                            nonlocal tooltip
-                            x = event.widget.winfo_rootx() + 25
-                            y = event.widget.winfo_rooty() + 20
-                            
-                            # Create a toplevel window
-                            tooltip = tk.Toplevel(widget)
-                            tooltip.wm_overrideredirect(True)
-                            tooltip.wm_geometry(f"+{x}+{y}")
-                            
-                            label = tk.Label(tooltip, text=tooltip_text, wraplength=400,
-                                          background="#ffffe0", relief="solid", borderwidth=1)
-                            label.pack(padx=2, pady=2)
-                        
-                        def leave(event):
-                            nonlocal tooltip
-                            if tooltip:
-                                tooltip.destroy()
-                                tooltip = None
-                        
-                        widget.bind("<Enter>", enter)
-                        widget.bind("<Leave>", leave)
-                    
-                    create_tooltip(cb, title)
-                
-                # Add publish date if available
-                if "published" in item:
-                    date_label = ttk.Label(frame, text=f"({item.get('published', '')})")
-                    date_label.pack(side="left", padx=5)
-                
-                # Add a thumbnail indicator if available
-                if "thumbnail" in item and item["thumbnail"]:
-                    # Just show a placeholder text for the thumbnail
-                    thumb_label = ttk.Label(frame, text="[Thumbnail]", foreground="blue")
-                    thumb_label.pack(side="right", padx=5)
+                    published = ""
+                rows.append((title, published))
+            
+            tree = self._create_video_list(videos_frame, rows, selected)
             
             # Store items for later use when saving
             videos_frame.items = selected_videos
             
-            # Update canvas
-            videos_frame.update_idletasks()
-            if hasattr(videos_frame.master, "config") and hasattr(videos_frame.master, "bbox"):
-                videos_frame.master.config(scrollregion=videos_frame.master.bbox("all"))
-
-            # Clear any source-related prompt messages at the bottom of the dialog
-            # Only if we have a dialog instance
-            if hasattr(self, 'dialog') and self.dialog is not None:
-                try:
-                    # Find the status message at the bottom of the dialog
-                    for widget in self.dialog.winfo_children():
-                        if isinstance(widget, ttk.Label) and hasattr(widget, 'cget'):
-                            try:
-                                if widget.cget('text') == "Please enter a source":
-                                    widget.config(text="")
-                            except:
-                                pass
-                except Exception as e:
-                    # Just log and continue if there's any issue clearing messages
-                    logger.debug(f"Error clearing source message: {e}")
+            # Clear the source prompt at the bottom of the dialog, if it is shown
+            if self._dialog_status_var is not None and self._dialog_status_var.get() == "Please enter a source":
+                self._dialog_status_var.set("")
             
         except Exception as e:
             logger.error(f"Error loading selected videos: {e}", exc_info=True)
@@ -102,6 +102,8 @@ class YouTubeTab(BaseUI):
         self.videos = []
         self.selected_videos = []
         self.video_checkboxes = []
+        # Optional callback called with each new list of search results
+        self.on_results = None
         super().__init__(parent, config_manager, "YouTube")
     
     def _init_ui(self):
@@ -385,6 +387,9 @@ class YouTubeTab(BaseUI):
         Args:
             videos: List of video items
         """
+        if self.on_results:
+            self.on_results(videos)
+        
         # Clear previous results
         for widget in self.results_frame.winfo_children():
             widget.destroy()
@@ -0,0 +1,261 @@
+"""
+Caching utilities for Discord Webhook Bot.
+
+This module provides caches whose entries expire after a time-to-live, kept in
+memory or persisted to disk.
+"""
+
+import os
+import json
+import time
+import atexit
+import shelve
+import threading
+import logging
+from collections import OrderedDict
+
+# Setup logger
+logger = logging.getLogger('content_curator.utils.cache')
+
+# Default size limit of caches kept in the config directory
+DEFAULT_CACHE_SIZE_MB = 5
+
+# Caches kept in config directories, by file path
+_config_caches = {}
+_config_caches_lock = threading.Lock()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry time-to-live."""
+
+    def __init__(self, maxsize=128, clock=time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used entry is evicted beyond this
+            clock: Function returning the current time in seconds
+        """
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the value expires
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        """Number of stored values, including any not yet found to be expired."""
+        return len(self._entries)
+
+
+class PersistentTTLCache:
+    """
+    TTL cache persisted to a shelve file so entries survive restarts.
+    
+    Keys and values must be JSON-serializable; tuples come back as lists. The
+    least recently used entries are evicted once the stored values exceed max_bytes.
+    The file is synced once per write call and when the cache is closed. Removals
+    alone are not synced; one lost in a crash only brings back a cached entry.
+    """
+
+    def __init__(self, path, max_bytes, clock=time.time):
+        """
+        Initialize the cache. The file is opened on first use.
+
+        Args:
+            path: Path of the shelve file
+            max_bytes: Maximum total size of the serialized values
+            clock: Function returning the current wall-clock time in seconds
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._shelf = None
+        # Serialized key -> (expires_at, value, size), least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Open the shelve file and load its unexpired entries."""
+        self._shelf = shelve.open(self.path)
+        now = self._clock()
+        loaded = []
+        for skey in list(self._shelf.keys()):
+            expires_at, text = self._shelf[skey]
+            if expires_at <= now:
+                del self._shelf[skey]
+            else:
+                loaded.append((expires_at, skey, text))
+        # Entries expiring soonest are treated as least recently used
+        for expires_at, skey, text in sorted(loaded):
+            self._entries[skey] = (expires_at, json.loads(text), len(text))
+            self._size += len(text)
+        self._evict()
+        self._shelf.sync()
+        logger.info(f"Loaded {len(self._entries)} cached entries from {self.path}")
+
+    def _remove(self, skey):
+        """Remove an entry from memory and disk."""
+        entry = self._entries.pop(skey, None)
+        if entry is not None:
+            self._size -= entry[2]
+            del self._shelf[skey]
+
+    def _evict(self):
+        """Remove least recently used entries until the size limit is met."""
+        while self._size > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+
+    def get(self, key):
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        skey = json.dumps(key)
+        with self._lock:
+            if self._shelf is None:
+                self._open()
+            entry = self._entries.get(skey)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                self._remove(skey)
+                return None
+            self._entries.move_to_end(skey)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        """
+        Store a value in memory and on disk.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the value expires
+        """
+        self.set_many([(key, value)], ttl)
+    
+    def set_many(self, items, ttl):
+        """
+        Store several values, syncing the file once.
+        
+        Args:
+            items: (key, value) pairs
+            ttl: Seconds until the values expire
+        """
+        encoded = [(json.dumps(key), value, json.dumps(value)) for key, value in items]
+        if not encoded:
+            return
+        expires_at = self._clock() + ttl
+        with self._lock:
+            if self._shelf is None:
+                self._open()
+            for skey, value, text in encoded:
+                self._remove(skey)
+                self._entries[skey] = (expires_at, value, len(text))
+                self._size += len(text)
+                self._shelf[skey] = (expires_at, text)
+            self._evict()
+            self._shelf.sync()
+
+    def delete(self, key):
+        """
+        Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            if self._shelf is None:
+                self._open()
+            self._remove(json.dumps(key))
+
+    def close(self):
+        """Close the shelve file."""
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+                self._entries.clear()
+                self._size = 0
+
+
+def get_config_cache(config_manager, name):
+    """
+    Get a persistent cache stored in the config directory.
+    
+    The cache file is "<name>_cache" and its size limit comes from the
+    "cache.<name>_size_mb" config option. Each file is opened by one cache,
+    shared by all callers and closed at exit.
+    
+    Args:
+        config_manager: Configuration manager instance
+        name: Cache name, such as "reddit"
+        
+    Returns:
+        PersistentTTLCache: Cache for the name
+    """
+    path = os.path.join(config_manager.config_dir, f"{name}_cache")
+    with _config_caches_lock:
+        cache = _config_caches.get(path)
+        if cache is None:
+            size_mb = config_manager.config.get("cache", {}).get(f"{name}_size_mb", DEFAULT_CACHE_SIZE_MB)
+            cache = PersistentTTLCache(path, int(size_mb * 1024 * 1024))
+            atexit.register(cache.close)
+            _config_caches[path] = cache
+        return cache
@@ -0,0 +1,90 @@
+"""
+Encryption utilities for Discord Webhook Bot.
+
+This module encrypts secret credential values before they are written to the config file.
+"""
+
+import os
+import logging
+from typing import Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+# Setup logger
+logger = logging.getLogger('content_curator.utils.encryption')
+
+# Name of the key file stored next to the config file
+KEY_FILENAME = "secret.key"
+
+# Ciphers by config directory, so the key file is read once
+_ciphers: Dict[str, Fernet] = {}
+
+
+def get_cipher(config_dir: str) -> Fernet:
+    """
+    Get the cipher for a config directory, creating its key on first use.
+
+    Args:
+        config_dir: Directory holding the config and key files
+
+    Returns:
+        Fernet cipher
+    """
+    cipher = _ciphers.get(config_dir)
+    if cipher is not None:
+        return cipher
+
+    key_file = os.path.join(config_dir, KEY_FILENAME)
+    if os.path.exists(key_file):
+        with open(key_file, "rb") as f:
+            key = f.read().strip()
+    else:
+        key = Fernet.generate_key()
+        os.makedirs(config_dir, exist_ok=True)
+        # Only the current user may read the key
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        logger.info(f"Created encryption key: {key_file}")
+
+    cipher = Fernet(key)
+    _ciphers[config_dir] = cipher
+    return cipher
+
+
+def encrypt_value(cipher: Fernet, value: Optional[str]) -> Optional[str]:
+    """
+    Encrypt a string value.
+
+    Args:
+        cipher: Cipher from get_cipher
+        value: Plaintext value
+
+    Returns:
+        Encrypted token, or the value unchanged if it is empty
+    """
+    if not value:
+        return value
+    return cipher.encrypt(value.encode()).decode()
+
+
+def decrypt_value(cipher: Fernet, value: Optional[str]) -> Optional[str]:
+    """
+    Decrypt a string value.
+
+    Values that are not encrypted tokens, such as credentials saved before
+    encryption was added, are returned unchanged.
+
+    Args:
+        cipher: Cipher from get_cipher
+        value: Encrypted token or plaintext value
+
+    Returns:
+        Plaintext value
+    """
+    if not value:
+        return value
+    try:
+        return cipher.decrypt(value.encode()).decode()
+    except InvalidToken:
+        return value
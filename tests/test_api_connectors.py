@@ -184,6 +184,31 @@ class TestDiscordConnector(unittest.TestCase):
         # Verify that APIError is raised
         with self.assertRaises(APIAuthenticationError):
             connector.send_message("Test message")
+    
+    @patch('time.sleep')
+    @patch('requests.post')
+    def test_webhook_rate_limit_wait_capped(self, mock_post, mock_sleep):
+        """Test that long or unreadable rate limit waits are not slept through."""
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "3600"}
+        mock_post.return_value = mock_response
+        
+        connector = DiscordConnector()
+        result = connector.send_webhook_message("https://discord.com/api/webhooks/test", content="Test")
+        
+        self.assertFalse(result["success"])
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+        
+        # An unreadable header falls back to the body, then to one second
+        mock_response.headers = {"Retry-After": "soon"}
+        mock_response.json.return_value = {}
+        mock_post.reset_mock()
+        connector.send_webhook_message("https://discord.com/api/webhooks/test", content="Test")
+        
+        mock_sleep.assert_called_once_with(1.0)
+        self.assertEqual(mock_post.call_count, 2)
 
 
 class TestRedditConnector(unittest.TestCase):
@@ -0,0 +1,122 @@
+"""
+Tests for the cache utility module.
+"""
+
+import unittest
+import os
+import tempfile
+from types import SimpleNamespace
+from src.utils.cache import TTLCache, PersistentTTLCache, get_config_cache
+
+
+class FakeClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+
+    def setUp(self):
+        """Set up a cache with a controllable clock."""
+        self.clock = FakeClock()
+        self.cache = TTLCache(maxsize=2, clock=self.clock)
+
+    def test_get_before_expiry(self):
+        """Test that values are returned until their TTL passes."""
+        self.cache.set("key", [1, 2], ttl=60)
+        self.clock.now = 59
+        self.assertEqual(self.cache.get("key"), [1, 2])
+
+        self.clock.now = 60
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        self.cache.set("a", 1, ttl=60)
+        self.cache.set("b", 2, ttl=60)
+        self.cache.get("a")
+        self.cache.set("c", 3, ttl=60)
+
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("c"), 3)
+
+    def test_delete(self):
+        """Test that deleted values are no longer returned."""
+        self.cache.set("key", "value", ttl=60)
+        self.cache.delete("key")
+        self.cache.delete("missing")
+        self.assertIsNone(self.cache.get("key"))
+
+
+class TestPersistentTTLCache(unittest.TestCase):
+    """Test cases for PersistentTTLCache."""
+
+    def setUp(self):
+        """Set up a temporary cache file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cache")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        """Remove the temporary cache file."""
+        self.temp_dir.cleanup()
+
+    def test_survives_reopen(self):
+        """Test that unexpired entries are loaded by a new cache."""
+        cache = PersistentTTLCache(self.path, max_bytes=1000, clock=self.clock)
+        cache.set(["reddit", "python"], [{"title": "Post"}], ttl=60)
+        cache.set(["reddit", "old"], [], ttl=10)
+        cache.close()
+
+        self.clock.now = 30
+        reopened = PersistentTTLCache(self.path, max_bytes=1000, clock=self.clock)
+        self.assertEqual(reopened.get(["reddit", "python"]), [{"title": "Post"}])
+        self.assertIsNone(reopened.get(["reddit", "old"]))
+        reopened.close()
+
+    def test_size_limit_evicts_lru(self):
+        """Test that the least recently used entries are evicted past the size limit."""
+        cache = PersistentTTLCache(self.path, max_bytes=30, clock=self.clock)
+        cache.set("a", "x" * 10, ttl=60)
+        cache.set("b", "y" * 10, ttl=60)
+        cache.get("a")
+        cache.set("c", "z" * 10, ttl=60)
+
+        self.assertEqual(cache.get("a"), "x" * 10)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "z" * 10)
+        cache.close()
+
+    def test_set_many(self):
+        """Test that values stored together are all kept across a reopen."""
+        cache = PersistentTTLCache(self.path, max_bytes=1000, clock=self.clock)
+        cache.set_many([(["posted", "a"], True), (["posted", "b"], True)], ttl=60)
+        cache.close()
+        
+        reopened = PersistentTTLCache(self.path, max_bytes=1000, clock=self.clock)
+        self.assertTrue(reopened.get(["posted", "a"]))
+        self.assertTrue(reopened.get(["posted", "b"]))
+        reopened.close()
+    
+    def test_config_cache_shared(self):
+        """Test that config caches are shared per name and sized from the config."""
+        config_manager = SimpleNamespace(config_dir=self.temp_dir.name,
+                                         config={"cache": {"youtube_size_mb": 1}})
+        cache = get_config_cache(config_manager, "youtube")
+        
+        self.assertIs(get_config_cache(config_manager, "youtube"), cache)
+        self.assertIsNot(get_config_cache(config_manager, "reddit"), cache)
+        self.assertEqual(cache.max_bytes, 1024 * 1024)
+        self.assertEqual(cache.path, os.path.join(self.temp_dir.name, "youtube_cache"))
+
+
+if __name__ == "__main__":
+    unittest.main()
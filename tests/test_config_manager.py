@@ -0,0 +1,146 @@
+"""
+Tests for the configuration manager.
+"""
+
+import unittest
+import os
+import json
+import tempfile
+import gc
+from src.ui.base_ui import ConfigManager, json_text
+
+
+class TestConfigManager(unittest.TestCase):
+    """Test cases for ConfigManager."""
+
+    def setUp(self):
+        """Set up a temporary config directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_dir = self.temp_dir.name
+        self.config_file = os.path.join(self.config_dir, "config.json")
+        self.managers = []
+
+    def tearDown(self):
+        """Stop the managers' writers and remove the temporary config directory."""
+        for manager in self.managers:
+            manager.close()
+        self.temp_dir.cleanup()
+
+    def _manager(self):
+        """Create a manager that is closed when the test ends."""
+        manager = ConfigManager(self.config_dir)
+        self.managers.append(manager)
+        return manager
+
+    def _read_config_file(self):
+        """Read the config file from disk."""
+        with open(self.config_file, "r") as f:
+            return json.load(f)
+
+    def test_save_and_reload(self):
+        """Test that saved config is loaded by a new manager."""
+        manager = self._manager()
+        manager.update_config("webhooks", [{"name": "Test", "url": "https://example.com"}])
+        manager.flush()
+
+        self.assertEqual(self._read_config_file()["webhooks"][0]["name"], "Test")
+        self.assertEqual(self._manager().config["webhooks"][0]["name"], "Test")
+
+    def test_loaded_config_is_independent(self):
+        """Test that managers do not share loaded config data."""
+        writer = self._manager()
+        writer.update_config("webhooks", [])
+        writer.flush()
+        first = self._manager()
+        first.config["webhooks"].append({"name": "Unsaved"})
+
+        self.assertEqual(self._manager().config["webhooks"], [])
+
+    def test_external_changes_reloaded(self):
+        """Test that a file changed outside the manager is parsed again."""
+        writer = self._manager()
+        writer.update_config("webhooks", [])
+        writer.flush()
+        with open(self.config_file, "w") as f:
+            json.dump({"webhooks": [{"name": "External"}]}, f)
+
+        self.assertEqual(self._manager().config["webhooks"][0]["name"], "External")
+
+    def test_only_latest_snapshot_written(self):
+        """Test that queued saves write the latest config state."""
+        manager = self._manager()
+        for i in range(5):
+            manager.update_config("webhooks", [{"name": f"Webhook {i}"}])
+        manager.flush()
+
+        self.assertEqual(self._read_config_file()["webhooks"], [{"name": "Webhook 4"}])
+        self.assertEqual(os.listdir(self.config_dir), ["config.json"])
+
+    def test_write_config_not_overwritten(self):
+        """Test that snapshots queued before a direct write don't overwrite it."""
+        manager = self._manager()
+        manager.update_config("webhooks", [{"name": "Queued"}])
+        manager.config["webhooks"] = [{"name": "Direct"}]
+        manager.write_config(json_text)
+        manager.flush()
+
+        self.assertEqual(self._read_config_file()["webhooks"], [{"name": "Direct"}])
+        self.assertEqual(os.listdir(self.config_dir), ["config.json"])
+
+    def test_save_config_text(self):
+        """Test that queued config text is written by the writer thread."""
+        manager = self._manager()
+        manager.update_config("webhooks", [{"name": "Queued"}])
+        manager.config["webhooks"] = [{"name": "Text"}]
+        manager.save_config_text(json_text(manager.config))
+        manager.flush()
+
+        self.assertEqual(self._read_config_file()["webhooks"], [{"name": "Text"}])
+        self.assertEqual(os.listdir(self.config_dir), ["config.json"])
+
+    def test_underscore_keys_not_saved(self):
+        """Test that runtime-only underscore keys are left out of the file."""
+        manager = self._manager()
+        task = {"id": "task_1", "_display_status": "Enabled"}
+        manager.update_config("scheduled_tasks", [task])
+        manager.flush()
+
+        self.assertEqual(self._read_config_file()["scheduled_tasks"], [{"id": "task_1"}])
+        self.assertEqual(task["_display_status"], "Enabled")
+
+    def test_close_stops_writer(self):
+        """Test that closing writes queued config and stops the writer thread."""
+        manager = self._manager()
+        manager.update_config("webhooks", [{"name": "Last"}])
+        thread = manager._save_thread
+        manager.close()
+        manager.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self._read_config_file()["webhooks"], [{"name": "Last"}])
+
+    def test_dead_observers_dropped(self):
+        """Test that observers of garbage collected objects are removed."""
+        class Observer:
+            def __init__(self):
+                self.calls = 0
+
+            def on_config_changed(self):
+                self.calls += 1
+
+        manager = self._manager()
+        kept = Observer()
+        dropped = Observer()
+        manager.add_observer(kept.on_config_changed)
+        manager.add_observer(dropped.on_config_changed)
+        del dropped
+        gc.collect()
+
+        manager._notify_observers()
+
+        self.assertEqual(kept.calls, 1)
+        self.assertEqual(len(manager.observers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for the encryption utility module.
+"""
+
+import unittest
+import os
+import stat
+import tempfile
+from src.utils.encryption import get_cipher, encrypt_value, decrypt_value, KEY_FILENAME
+
+
+class TestEncryption(unittest.TestCase):
+    """Test cases for credential encryption."""
+    
+    def setUp(self):
+        """Set up a temporary config directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_dir = self.temp_dir.name
+        self.cipher = get_cipher(self.config_dir)
+    
+    def tearDown(self):
+        """Remove the temporary config directory."""
+        self.temp_dir.cleanup()
+    
+    def test_key_file_created(self):
+        """Test that the key file is created readable by the owner only."""
+        key_file = os.path.join(self.config_dir, KEY_FILENAME)
+        self.assertTrue(os.path.exists(key_file))
+        self.assertEqual(stat.S_IMODE(os.stat(key_file).st_mode), 0o600)
+    
+    def test_round_trip(self):
+        """Test that encrypted values decrypt to the original."""
+        token = encrypt_value(self.cipher, "secret")
+        self.assertNotEqual(token, "secret")
+        self.assertEqual(decrypt_value(self.cipher, token), "secret")
+    
+    def test_plaintext_passthrough(self):
+        """Test that values saved before encryption are returned unchanged."""
+        self.assertEqual(decrypt_value(self.cipher, "plain-api-key"), "plain-api-key")
+    
+    def test_empty_values(self):
+        """Test that empty values are not encrypted."""
+        self.assertEqual(encrypt_value(self.cipher, ""), "")
+        self.assertIsNone(decrypt_value(self.cipher, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
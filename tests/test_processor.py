@@ -210,6 +210,53 @@ class TestContentProcessor(unittest.TestCase):
         formatted = self.processor.format_content_with_template(item, template)
         expected = "Test Video that should pass by Test Channel with "
         self.assertEqual(formatted, expected)
+    
+    def test_process_content_interns_keys(self):
+        """Test that processed items use the interned field names."""
+        # Build keys at runtime so they are not the interned literals
+        item = {"".join(["ti", "tle"]): "Test Video", "".join(["ur", "l"]): "https://example.com"}
+        processor = ContentProcessor({"filters": {"global": {}}, "formatting": {}})
+        processed = processor.process_content("other", [item])
+        keys = list(processed[0]["original_item"].keys())
+        self.assertIs(keys[0], sys.intern("title"))
+        self.assertIs(keys[1], sys.intern("url"))
+    
+    def test_filters_see_changed_items(self):
+        """Test that an item changed after filtering is filtered on its new text."""
+        processor = ContentProcessor({"filters": {"global": {"keywords_exclude": ["spoiler"]}}})
+        item = {"title": "Trailer"}
+        self.assertTrue(processor.passes_global_filters(item))
+        
+        item["title"] = "Spoiler review"
+        self.assertFalse(processor.passes_global_filters(item))
+        self.assertEqual(list(item), ["title"])
+    
+    def test_discord_content_keeps_missing_placeholders(self):
+        """Test that Discord content leaves placeholders of missing fields as text."""
+        item = {"channel": "Test Channel", "title": "Video", "url": "https://example.com"}
+        content = self.processor.format_for_discord("youtube", item)["content"]
+        expected = "**New Video from Test Channel**\n\nVideo\n\n{views} views | {likes} likes\n\nhttps://example.com"
+        self.assertEqual(content, expected)
+    
+    def test_embed_disabled(self):
+        """Test that no embed is built when disabled for a platform."""
+        self.config["formatting"]["youtube"]["embed"] = False
+        processor = ContentProcessor(self.config)
+        
+        formatted = processor.format_for_discord("youtube", self.youtube_items[0])
+        self.assertIsNone(formatted["embed"])
+        
+        formatted = processor.format_for_discord("reddit", self.reddit_items[0])
+        self.assertEqual(formatted["embed"]["title"], "Test Post that should pass")
+    
+    def test_embed_fields(self):
+        """Test platform-specific embed fields."""
+        embed = self.processor.format_for_discord("reddit", self.reddit_items[0])["embed"]
+        self.assertEqual(embed["fields"], [
+            {"name": "Upvotes", "value": "1,000", "inline": True},
+            {"name": "Comments", "value": "50", "inline": True},
+            {"name": "Subreddit", "value": "r/test", "inline": True}
+        ])
 
 
 if __name__ == "__main__":
@@ -13,8 +13,9 @@ from datetime import datetime, timedelta
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.ui.schedule_tab import ScheduleTab
+from src.ui.schedule_tab import ScheduleTab, _config_json, _task_changed, _item_embed, _published_date, _new_items, _set_display_fields
 from src.ui.base_ui import ConfigManager
+from src.utils.cache import TTLCache
 
 
 class MockConfigManager:
@@ -53,6 +54,10 @@ class MockConfigManager:
         self.config = config
         for callback in self.observers:
             callback()
+    
+    def save_config_text(self, text):
+        """Save encoded config text."""
+        self.saved_text = text
 
 
 class TestScheduleTab(unittest.TestCase):
@@ -120,5 +125,90 @@ class TestScheduleTab(unittest.TestCase):
         self.assertEqual(self.config_manager.config["scheduled_tasks"], tasks)
 
 
+class TestConfigJson(unittest.TestCase):
+    """Tests for encoding the config file with cached task JSON."""
+    
+    def setUp(self):
+        """Set up a config with two tasks."""
+        self.config = {
+            "webhooks": [{"name": "Test Webhook", "url": "https://discord.com/api/webhooks/test"}],
+            "scheduled_tasks": [
+                {"id": "task_1", "enabled": True, "_display_status": "Enabled"},
+                {"id": "task_2", "selected_videos": [{"id": "abc", "title": "Video"}]}
+            ],
+            "settings": {}
+        }
+    
+    def _expected(self):
+        """Encode the config the way json.dump writes it."""
+        tasks = [{k: v for k, v in task.items() if not k.startswith("_")}
+                 for task in self.config["scheduled_tasks"]]
+        return json.dumps({**self.config, "scheduled_tasks": tasks}, indent=4)
+    
+    def test_matches_json_dump(self):
+        """Test that the spliced output matches a plain dump without underscore keys."""
+        self.assertEqual(_config_json(self.config), self._expected())
+        self.assertEqual(_config_json({"scheduled_tasks": []}), json.dumps({"scheduled_tasks": []}, indent=4))
+    
+    def test_changed_task_encoded_again(self):
+        """Test that a changed task is encoded again once marked as changed."""
+        _config_json(self.config)
+        task = self.config["scheduled_tasks"][0]
+        task["enabled"] = False
+        _task_changed(task)
+        
+        self.assertEqual(_config_json(self.config), self._expected())
+
+
+class TestDisplayFields(unittest.TestCase):
+    """Tests for formatting task fields for the tasks tree."""
+    
+    def test_next_run_formatted(self):
+        """Test that next run times are shown to the minute and missing ones are blank."""
+        task = {"enabled": False, "next_run": "2024-03-01T12:30:45.123456"}
+        _set_display_fields(task)
+        self.assertEqual(task["_display_status"], "Disabled")
+        self.assertEqual(task["_display_next_run"], "2024-03-01 12:30")
+        
+        task = {"next_run": None}
+        _set_display_fields(task)
+        self.assertEqual(task["_display_next_run"], "")
+
+
+class TestItemEmbed(unittest.TestCase):
+    """Tests for building the Discord embed of an item."""
+    
+    def test_description_shortened(self):
+        """Test that only descriptions over 200 characters are cut and marked."""
+        self.assertEqual(_item_embed({"description": "Short"}, "YouTube")["description"], "Short")
+        self.assertEqual(_item_embed({"description": None}, "YouTube")["description"], "")
+        
+        description = _item_embed({"description": "x" * 250}, "YouTube")["description"]
+        self.assertEqual(description, "x" * 197 + "...")
+
+
+class TestNewItems(unittest.TestCase):
+    """Tests for leaving out items that were already posted."""
+    
+    def test_repeated_and_posted_items_dropped(self):
+        """Test that repeated IDs and IDs posted to the same webhook are dropped."""
+        posted = TTLCache()
+        posted.set(("webhook_a", "old"), True, ttl=60)
+        items = [{"id": "new"}, {"id": "old"}, {"id": "new"}, {"title": "No ID"}]
+        
+        self.assertEqual(_new_items(items, posted, "webhook_a"), [{"id": "new"}, {"title": "No ID"}])
+        self.assertEqual(len(_new_items(items, posted, "webhook_b")), 3)
+
+
+class TestPublishedDate(unittest.TestCase):
+    """Tests for formatting published timestamps."""
+    
+    def test_published_date(self):
+        """Test that published timestamps are shown as dates."""
+        self.assertEqual(_published_date("2024-03-01T12:30:00Z"), "2024-03-01")
+        self.assertEqual(_published_date("yesterday"), "yesterday")
+        self.assertEqual(_published_date(""), "")
+
+
 if __name__ == "__main__":
     unittest.main()